@@ -22,6 +22,7 @@ from rem_db.models import (
     ChatSession,
     ChatMessage,
     ChatFeedback,
+    UsageDict,
     # Agent models
     AgentletSchema,
     MCPToolConfig,
@@ -68,6 +69,7 @@ __all__ = [
     "ChatSession",
     "ChatMessage",
     "ChatFeedback",
+    "UsageDict",
     # Agent models
     "AgentletSchema",
     "MCPToolConfig",
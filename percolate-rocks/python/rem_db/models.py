@@ -4,12 +4,34 @@ All models use Pydantic v2+ semantics with modern best practices (2025).
 Includes: Entity schemas, Sessions, Jobs, Replication, Export, and built-in REM patterns.
 """
 
+import copy
+import sys
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_validator,
+)
+from pydantic_core import from_json
+from typing_extensions import TypedDict
 
 
 # ====================================================================
@@ -87,6 +109,185 @@ class SchemaCategory(str, Enum):
     USER = "user"
 
 
+# Closed string vocabularies validated by pydantic-core's literal validator
+MessageRole = Literal["system", "user", "assistant", "tool"]
+WalOperation = Literal["insert", "update", "delete"]
+ParquetCompression = Optional[Literal["zstd", "snappy", "gzip", "lz4"]]
+
+# Low-cardinality strings (tenant IDs, entity types) interned on validation, so
+# rows loaded in bulk share one object per distinct value. Literal fields need
+# no interning: pydantic-core returns the declared constants.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
+# ====================================================================
+# ROW HYDRATION
+# ====================================================================
+
+_RowModelT = TypeVar("_RowModelT", bound="RowModel")
+
+# Table metadata ClassVars and the json_schema_extra keys they are published as
+_TABLE_METADATA_KEYS = (
+    ("EMBEDDING_FIELDS", "embedding_fields"),
+    ("INDEXED_FIELDS", "indexed_fields"),
+    ("KEY_FIELD", "key_field"),
+    ("CATEGORY", "category"),
+    ("FULLY_QUALIFIED_NAME", "fully_qualified_name"),
+    ("SHORT_NAME", "short_name"),
+    ("VERSION", "version"),
+)
+
+
+def _table_schema_extra(schema: dict[str, Any], cls: type) -> None:
+    """Publish a model's table metadata ClassVars in its JSON schema.
+
+    Unset (None) ClassVars are omitted; tuples are written as lists.
+    """
+    for attr, key in _TABLE_METADATA_KEYS:
+        value = getattr(cls, attr)
+        if value is not None:
+            schema[key] = list(value) if isinstance(value, tuple) else value
+
+
+def _text_parser(annotation: Any) -> Optional[Callable[[str], Any]]:
+    """Return the parser for a field type the database stores as text.
+
+    Datetimes (ISO 8601), UUIDs and enums are stored as strings; other field
+    types are stored in their Python form. Optional[X] is parsed as X.
+    """
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    if annotation is datetime:
+        return datetime.fromisoformat
+    if annotation is UUID or (isinstance(annotation, type) and issubclass(annotation, Enum)):
+        return annotation
+    return None
+
+
+class RowModel(BaseModel):
+    """Base for models hydrated from percolate-rocks rows.
+
+    Rows read back from the database were validated against the registered
+    schema when they were written, so `from_trusted_row` skips the validator
+    chain. Use `model_validate` for untrusted input (API ingress).
+
+    Subclasses declare empty `__slots__` so instances don't carry a
+    `__weakref__` slot (Pydantic keeps field values in `__dict__` regardless).
+
+    The default JSON schema is generated once per class and cached. Table
+    metadata (indexed fields, key field, ...) is declared as ClassVars and
+    published to the schema's json_schema_extra keys.
+
+    Low-cardinality string fields (roles, tenant IDs) share one object per
+    distinct value: validation interns `InternedStr` fields and returns
+    Literal constants, and `from_trusted_row` interns the fields listed in
+    `_interned_fields`.
+    """
+
+    __slots__ = ()
+
+    model_config = ConfigDict(json_schema_extra=_table_schema_extra)
+
+    # Table metadata for the database (read directly by indexers/serializers)
+    EMBEDDING_FIELDS: ClassVar[Optional[tuple[str, ...]]] = None
+    INDEXED_FIELDS: ClassVar[Optional[tuple[str, ...]]] = None
+    KEY_FIELD: ClassVar[Optional[str]] = None
+    CATEGORY: ClassVar[Optional[str]] = None
+    FULLY_QUALIFIED_NAME: ClassVar[Optional[str]] = None
+    SHORT_NAME: ClassVar[Optional[str]] = None
+    VERSION: ClassVar[Optional[str]] = None
+
+    _interned_fields: ClassVar[tuple[str, ...]] = ()
+    _text_fields: ClassVar[tuple[tuple[str, Callable[[str], Any]], ...]] = ()
+    _json_schema_cache: ClassVar[Optional[dict[str, Any]]] = None
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._text_fields = tuple(
+            (name, parser)
+            for name, field in cls.model_fields.items()
+            if (parser := _text_parser(field.annotation)) is not None
+        )
+        cls._json_schema_cache = None
+
+    @classmethod
+    def model_json_schema(cls, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Return the JSON schema, reusing the cached default schema.
+
+        Calls with non-default arguments are generated as usual. The cached
+        schema is deep-copied so callers may mutate the result.
+        """
+        if args or kwargs:
+            return super().model_json_schema(*args, **kwargs)
+        if cls._json_schema_cache is None:
+            cls._json_schema_cache = super().model_json_schema()
+        return copy.deepcopy(cls._json_schema_cache)
+
+    @classmethod
+    def from_trusted_row(cls: type[_RowModelT], row: dict[str, Any]) -> _RowModelT:
+        """Build instance from a database row without re-validating it.
+
+        Values are assigned as-is via `model_construct`, except strings in
+        datetime (ISO 8601), UUID and enum fields, which are parsed (the
+        database stores them as text), and `_interned_fields`, which are
+        interned. Field constraints
+        are not checked, so rows written before a constraint was added (e.g.
+        legacy trace IDs) still load. Keys that are not model fields are
+        ignored.
+
+        Args:
+            row: Entity properties as returned by the database
+
+        Returns:
+            Model instance with `model_fields_set` equal to the row's field keys
+        """
+        values = {name: row[name] for name in cls.model_fields if name in row}
+        for name in cls._interned_fields:
+            value = values.get(name)
+            if isinstance(value, str):
+                values[name] = sys.intern(value)
+        for name, parse in cls._text_fields:
+            value = values.get(name)
+            if isinstance(value, str):
+                values[name] = parse(value)
+        return cls.model_construct(**values)
+
+    @classmethod
+    def from_trusted_rows(
+        cls: type[_RowModelT], rows: Iterable[dict[str, Any]]
+    ) -> list[_RowModelT]:
+        """Build instances from a batch of database rows (e.g. chat history).
+
+        Each row is hydrated with `from_trusted_row`, so one row written before
+        a constraint was added doesn't fail the whole batch.
+
+        Args:
+            rows: Entity property dicts as returned by the database
+
+        Returns:
+            List of model instances, in row order
+        """
+        return [cls.from_trusted_row(row) for row in rows]
+
+    @classmethod
+    def from_trusted_json(cls: type[_RowModelT], data: Union[str, bytes]) -> list[_RowModelT]:
+        """Build instances from a JSON array of rows (e.g. a snapshot export).
+
+        The array is parsed by pydantic-core (jiter) and each row is hydrated
+        with `from_trusted_row`.
+
+        Args:
+            data: JSON array of entity property objects
+
+        Returns:
+            List of model instances, in array order
+        """
+        return cls.from_trusted_rows(from_json(data))
+
+
 # ====================================================================
 # SYSTEM MODELS (automatically managed by database)
 # ====================================================================
@@ -400,27 +601,48 @@ class Session(BaseModel):
 # ====================================================================
 
 
-class ChatSession(BaseModel):
+# W3C trace context IDs: 16-byte trace ID and 8-byte span ID, hex encoded
+TRACE_ID_PATTERN = r"^[0-9a-fA-F]{32}$"
+SPAN_ID_PATTERN = r"^[0-9a-fA-F]{16}$"
+
+
+class UsageDict(TypedDict, total=False):
+    """Token usage metrics stored on assistant messages.
+
+    Covers both pydantic-ai (input/output) and OpenAI (prompt/completion) names.
+    """
+
+    input_tokens: int
+    output_tokens: int
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+
+
+class ChatSession(RowModel):
     """Conversation session metadata for chat completions.
 
+    Frozen: sessions are updated by upserting a new row, never in place.
+
     Schema defined in percolate-rocks/src/schema/builtin.rs (sessions_table_schema).
     """
 
-    model_config = ConfigDict(
-        validate_assignment=True,
-        json_schema_extra={
-            "embedding_fields": [],
-            "indexed_fields": ["tenant_id", "agent_uri", "updated_at"],
-            "key_field": "session_id",
-            "category": "system",
-            "fully_qualified_name": "percolate.memory.ChatSession",
-            "short_name": "sessions",
-            "version": "1.0.0",
-        },
-    )
+    __slots__ = ()
+
+    _interned_fields: ClassVar[tuple[str, ...]] = ("tenant_id",)
+
+    EMBEDDING_FIELDS = ()
+    INDEXED_FIELDS = ("tenant_id", "agent_uri", "updated_at")
+    KEY_FIELD = "session_id"
+    CATEGORY = "system"
+    FULLY_QUALIFIED_NAME = "percolate.memory.ChatSession"
+    SHORT_NAME = "sessions"
+    VERSION = "1.0.0"
+
+    model_config = ConfigDict(frozen=True)
 
     session_id: str = Field(description="Unique session identifier")
-    tenant_id: str = Field(description="Tenant scope for isolation")
+    tenant_id: InternedStr = Field(description="Tenant scope for isolation")
     agent_uri: Optional[str] = Field(default=None, description="Agent used in session")
     message_count: int = Field(default=0, description="Number of messages")
     metadata: dict[str, Any] = Field(
@@ -430,66 +652,81 @@ class ChatSession(BaseModel):
     updated_at: datetime = Field(description="Last update timestamp")
 
 
-class ChatMessage(BaseModel):
+class ChatMessage(RowModel):
     """Individual message in a chat conversation.
 
+    Frozen: messages are immutable once written.
+
     Schema defined in percolate-rocks/src/schema/builtin.rs (messages_table_schema).
     """
 
-    model_config = ConfigDict(
-        validate_assignment=True,
-        json_schema_extra={
-            "embedding_fields": ["content"],
-            "indexed_fields": ["session_id", "tenant_id", "role", "timestamp"],
-            "key_field": "message_id",
-            "category": "system",
-            "fully_qualified_name": "percolate.memory.ChatMessage",
-            "short_name": "messages",
-            "version": "1.0.0",
-        },
-    )
+    __slots__ = ()
+
+    _interned_fields: ClassVar[tuple[str, ...]] = ("tenant_id", "role")
+
+    EMBEDDING_FIELDS = ("content",)
+    INDEXED_FIELDS = ("session_id", "tenant_id", "role", "timestamp")
+    KEY_FIELD = "message_id"
+    CATEGORY = "system"
+    FULLY_QUALIFIED_NAME = "percolate.memory.ChatMessage"
+    SHORT_NAME = "messages"
+    VERSION = "1.0.0"
 
+    model_config = ConfigDict(frozen=True)
+
+    # Fixed-size identifiers first, variable-length payload last
     message_id: str = Field(description="Unique message identifier (UUID)")
     session_id: str = Field(description="Parent session identifier")
-    tenant_id: str = Field(description="Tenant scope for isolation")
-    role: str = Field(description="Message role: user, assistant, or system")
-    content: str = Field(description="Message content")
-    model: Optional[str] = Field(default=None, description="Model that generated response")
+    tenant_id: InternedStr = Field(description="Tenant scope for isolation")
+    role: MessageRole = Field(description="Message role: system, user, assistant, or tool")
     timestamp: datetime = Field(description="Message timestamp")
-    usage: Optional[dict[str, int]] = Field(
+    model: Optional[str] = Field(default=None, description="Model that generated response")
+    trace_id: Optional[str] = Field(
+        default=None, pattern=TRACE_ID_PATTERN, description="OTEL trace ID (hex, 32 chars)"
+    )
+    span_id: Optional[str] = Field(
+        default=None, pattern=SPAN_ID_PATTERN, description="OTEL span ID (hex, 16 chars)"
+    )
+    content: str = Field(description="Message content")
+    usage: Optional[UsageDict] = Field(
         default=None, description="Token usage metrics"
     )
-    trace_id: Optional[str] = Field(default=None, description="OTEL trace ID (hex, 32 chars)")
-    span_id: Optional[str] = Field(default=None, description="OTEL span ID (hex, 16 chars)")
 
 
-class ChatFeedback(BaseModel):
+class ChatFeedback(RowModel):
     """User feedback on chat interactions.
 
+    Frozen: feedback is immutable once written.
+
     Schema defined in percolate-rocks/src/schema/builtin.rs (feedback_table_schema).
     """
 
-    model_config = ConfigDict(
-        validate_assignment=True,
-        json_schema_extra={
-            "embedding_fields": ["feedback_text"],
-            "indexed_fields": ["session_id", "message_id", "trace_id", "label", "timestamp"],
-            "key_field": "feedback_id",
-            "category": "system",
-            "fully_qualified_name": "percolate.memory.ChatFeedback",
-            "short_name": "feedback",
-            "version": "1.0.0",
-        },
-    )
+    __slots__ = ()
+
+    _interned_fields: ClassVar[tuple[str, ...]] = ("tenant_id",)
+
+    EMBEDDING_FIELDS = ("feedback_text",)
+    INDEXED_FIELDS = ("session_id", "message_id", "trace_id", "label", "timestamp")
+    KEY_FIELD = "feedback_id"
+    CATEGORY = "system"
+    FULLY_QUALIFIED_NAME = "percolate.memory.ChatFeedback"
+    SHORT_NAME = "feedback"
+    VERSION = "1.0.0"
+
+    model_config = ConfigDict(frozen=True)
 
     feedback_id: str = Field(description="Unique feedback identifier (UUID)")
     session_id: str = Field(description="Parent session identifier")
     message_id: Optional[str] = Field(
         default=None, description="Specific message being rated"
     )
-    tenant_id: str = Field(description="Tenant scope for isolation")
-    trace_id: Optional[str] = Field(default=None, description="OTEL trace ID for linking")
-    span_id: Optional[str] = Field(default=None, description="OTEL span ID for linking")
+    tenant_id: InternedStr = Field(description="Tenant scope for isolation")
+    trace_id: Optional[str] = Field(
+        default=None, pattern=TRACE_ID_PATTERN, description="OTEL trace ID for linking"
+    )
+    span_id: Optional[str] = Field(
+        default=None, pattern=SPAN_ID_PATTERN, description="OTEL span ID for linking"
+    )
     label: Optional[str] = Field(
         default=None,
         description="Feedback label (any string, e.g., 'thumbs_up', 'helpful')",
@@ -515,21 +752,22 @@ class ChatFeedback(BaseModel):
 # ====================================================================
 
 
-class Job(BaseModel):
+class Job(RowModel):
     """Background job tracking."""
 
-    model_config = ConfigDict(
-        validate_assignment=True,
-        json_schema_extra={
-            "indexed_fields": ["status", "job_type", "created_at"],
-            "category": "system",
-        },
-    )
+    __slots__ = ()
+
+    _interned_fields: ClassVar[tuple[str, ...]] = ("tenant_id",)
+
+    INDEXED_FIELDS = ("status", "job_type", "created_at")
+    CATEGORY = "system"
+
+    model_config = ConfigDict(validate_assignment=True)
 
     job_id: UUID = Field(description="Job UUID")
     job_type: JobType = Field(description="Type of job")
     status: JobStatus = Field(description="Current status")
-    tenant_id: str = Field(description="Tenant identifier")
+    tenant_id: InternedStr = Field(description="Tenant identifier")
     created_at: datetime = Field(description="Job creation time")
     started_at: Optional[datetime] = Field(default=None, description="Job start time")
     completed_at: Optional[datetime] = Field(
@@ -562,7 +800,7 @@ class ExportConfig(BaseModel):
     include_deleted: bool = Field(
         default=False, description="Include soft-deleted entities"
     )
-    compression: Optional[str] = Field(
+    compression: ParquetCompression = Field(
         default="zstd", description="Compression algorithm (parquet only)"
     )
 
@@ -572,9 +810,11 @@ class ExportConfig(BaseModel):
 # ====================================================================
 
 
-class ReplicationStatus(BaseModel):
+class ReplicationStatus(RowModel):
     """Replication status information."""
 
+    __slots__ = ()
+
     model_config = ConfigDict(validate_assignment=True)
 
     mode: ReplicationMode = Field(description="Replication mode")
@@ -588,23 +828,29 @@ class ReplicationStatus(BaseModel):
     connected: bool = Field(default=False, description="Connection status")
 
 
-class WalEntry(BaseModel):
+class WalEntry(RowModel):
     """Write-Ahead Log entry."""
 
-    model_config = ConfigDict(validate_assignment=True, frozen=True)
+    __slots__ = ()
+
+    _interned_fields: ClassVar[tuple[str, ...]] = ("tenant_id", "operation", "entity_type")
+
+    model_config = ConfigDict(frozen=True)
 
     sequence: int = Field(description="WAL sequence number")
-    tenant_id: str = Field(description="Tenant identifier")
-    operation: str = Field(description="Operation type (insert/update/delete)")
-    entity_type: str = Field(description="Entity type")
     entity_id: UUID = Field(description="Entity UUID")
     timestamp: datetime = Field(description="Operation timestamp")
+    tenant_id: InternedStr = Field(description="Tenant identifier")
+    operation: WalOperation = Field(description="Operation type (insert/update/delete)")
+    entity_type: InternedStr = Field(description="Entity type")
     data: Optional[dict[str, Any]] = Field(default=None, description="Operation data")
 
 
-class WalStatus(BaseModel):
+class WalStatus(RowModel):
     """Write-Ahead Log status."""
 
+    __slots__ = ()
+
     model_config = ConfigDict(validate_assignment=True)
 
     current_sequence: int = Field(description="Current WAL sequence")
@@ -623,9 +869,11 @@ class WalStatus(BaseModel):
 # ====================================================================
 
 
-class SchemaInfo(BaseModel):
+class SchemaInfo(RowModel):
     """Schema metadata information."""
 
+    __slots__ = ()
+
     model_config = ConfigDict(validate_assignment=True)
 
     name: str = Field(description="Schema name")
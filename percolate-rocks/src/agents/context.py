@@ -1,6 +1,9 @@
 """Agent execution context for configuration and state propagation."""
 
-from pydantic import BaseModel, Field
+from collections.abc import Mapping
+from functools import lru_cache
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AgentContext(BaseModel):
@@ -18,8 +21,13 @@ class AgentContext(BaseModel):
         default_model: LLM model to use for agent execution
         agent_schema_uri: URI to agent-let schema (e.g., 'researcher', 'classifier')
         db_path: Path to percolate-rocks database (defaults to ~/.p8/db/)
+
+    Contexts are immutable, so from_headers can hand out one shared instance
+    per distinct set of header values.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     user_id: str | None = Field(
         default=None,
         description="User identifier for tenant scoping"
@@ -49,7 +57,7 @@ class AgentContext(BaseModel):
     )
 
     @classmethod
-    def from_headers(cls, headers: dict[str, str], tenant_id: str) -> "AgentContext":
+    def from_headers(cls, headers: Mapping[str, str], tenant_id: str) -> "AgentContext":
         """Extract agent context from HTTP headers.
 
         Maps standard X-* headers to context fields:
@@ -74,12 +82,37 @@ class AgentContext(BaseModel):
             'user-123'
         """
         normalized = {k.lower(): v for k, v in headers.items()}
+        # Cache on the mapped values only, so unrelated headers (request IDs,
+        # user agents, ...) don't defeat the cache
+        return cls._from_header_values(
+            tenant_id,
+            normalized.get("x-user-id"),
+            normalized.get("x-session-id"),
+            normalized.get("x-device-id"),
+            normalized.get("x-model-name", "claude-sonnet-4.5"),
+            normalized.get("x-agent-schema"),
+            normalized.get("x-db-path"),
+        )
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _from_header_values(
+        cls,
+        tenant_id: str,
+        user_id: str | None,
+        session_id: str | None,
+        device_id: str | None,
+        default_model: str,
+        agent_schema_uri: str | None,
+        db_path: str | None,
+    ) -> "AgentContext":
+        """Build (and cache) a context from extracted header values."""
         return cls(
-            user_id=normalized.get("x-user-id"),
+            user_id=user_id,
             tenant_id=tenant_id,
-            session_id=normalized.get("x-session-id"),
-            device_id=normalized.get("x-device-id"),
-            default_model=normalized.get("x-model-name", "claude-sonnet-4.5"),
-            agent_schema_uri=normalized.get("x-agent-schema"),
-            db_path=normalized.get("x-db-path"),
+            session_id=session_id,
+            device_id=device_id,
+            default_model=default_model,
+            agent_schema_uri=agent_schema_uri,
+            db_path=db_path,
         )
@@ -8,7 +8,13 @@ Key patterns from carrier reference:
 - Tenant isolation for user agent-lets
 """
 
-from typing import Any
+import copy
+import hashlib
+import json
+import logging
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from typing import Any, Callable, ClassVar
 
 from pydantic import BaseModel, Field, create_model
 from pydantic_ai import Agent
@@ -18,12 +24,72 @@ from .context import AgentContext
 from .registry import load_agentlet_schema
 from .tool_wrapper import create_pydantic_tool
 
+logger = logging.getLogger(__name__)
+
+# MCP server names served by in-process tool functions
+_LOCAL_MCP_SERVERS = frozenset({"percolate", "default", "demo"})
+
+# Map JSON schema types to Python types
+_JSON_TYPE_MAP: dict[str, type] = {
+    "string": str,
+    "number": float,
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+# list[...] annotations for typed arrays, built once
+_JSON_LIST_TYPE_MAP: dict[str, Any] = {
+    json_type: list[py_type] for json_type, py_type in _JSON_TYPE_MAP.items()
+}
+
+# `T | None` annotations for optional fields, shared across fields and models
+_OPTIONAL_TYPE_CACHE: dict[Any, Any] = {}
+
+
+def _optional(field_type: Any) -> Any:
+    """Return the cached `field_type | None` union."""
+    optional = _OPTIONAL_TYPE_CACHE.get(field_type)
+    if optional is None:
+        optional = _OPTIONAL_TYPE_CACHE[field_type] = field_type | None
+    return optional
+
+
+# Dynamic models keyed by a digest of the schema parts that shape the model
+# (LRU-bounded, schemas come from many tenants)
+_MODEL_CACHE: OrderedDict[bytes, type[BaseModel]] = OrderedDict()
+_MODEL_CACHE_SIZE = 256
+
+
+def _schema_cache_key(json_schema: dict[str, Any]) -> bytes:
+    """Compute a content-addressed cache key for a JSON schema.
+
+    Only title, properties and required affect the generated model, so other
+    keys (description, json_schema_extra, ...) don't fragment the cache.
+
+    Args:
+        json_schema: JSON Schema dict
+
+    Returns:
+        BLAKE2b digest of the canonical (sorted-key) JSON encoding
+    """
+    shape = {
+        "title": json_schema.get("title"),
+        "properties": json_schema.get("properties", {}),
+        "required": json_schema.get("required", []),
+    }
+    canonical = json.dumps(shape, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
 
 def _create_model_from_schema(json_schema: dict[str, Any]) -> type[BaseModel]:
     """Create a dynamic Pydantic model from JSON Schema.
 
     Converts agent-let JSON schema to a Pydantic model for structured output.
     Handles basic types (string, number, boolean, array) and required fields.
+    Models are cached by schema content (the 256 most recently used), so the
+    same agent-let schema builds its model once per process.
 
     Args:
         json_schema: JSON Schema dict with properties and required fields
@@ -31,41 +97,41 @@ def _create_model_from_schema(json_schema: dict[str, Any]) -> type[BaseModel]:
     Returns:
         Dynamically created Pydantic model class
     """
+    cache_key = _schema_cache_key(json_schema)
+    cached = _MODEL_CACHE.get(cache_key)
+    if cached is not None:
+        _MODEL_CACHE.move_to_end(cache_key)
+        return cached
+
     properties = json_schema.get("properties", {})
     required = json_schema.get("required", [])
     model_name = json_schema.get("title", "DynamicAgent")
 
-    # Map JSON schema types to Python types
-    type_map = {
-        "string": str,
-        "number": float,
-        "integer": int,
-        "boolean": bool,
-        "array": list,
-        "object": dict,
-    }
-
     # Build field definitions for create_model
     field_definitions = {}
     for field_name, field_spec in properties.items():
-        field_type = type_map.get(field_spec.get("type", "string"), str)
+        field_type = _JSON_TYPE_MAP.get(field_spec.get("type", "string"), str)
         field_description = field_spec.get("description", "")
 
         # Handle array types with items
         if field_spec.get("type") == "array" and "items" in field_spec:
-            item_type = type_map.get(field_spec["items"].get("type", "string"), str)
-            field_type = list[item_type]  # type: ignore
+            field_type = _JSON_LIST_TYPE_MAP.get(field_spec["items"].get("type", "string"), list[str])
 
         # Determine if required
         if field_name in required:
             field_definitions[field_name] = (field_type, Field(description=field_description))
         else:
-            field_definitions[field_name] = (field_type | None, Field(default=None, description=field_description))
+            field_definitions[field_name] = (_optional(field_type), Field(default=None, description=field_description))
 
     # Create dynamic model
-    return create_model(model_name, **field_definitions)
+    model = create_model(model_name, **field_definitions)
+    _MODEL_CACHE[cache_key] = model
+    if len(_MODEL_CACHE) > _MODEL_CACHE_SIZE:
+        _MODEL_CACHE.popitem(last=False)
+    return model
 
 
+@lru_cache(maxsize=512)
 def _create_schema_wrapper(result_type: type[BaseModel], strip_description: bool = True) -> type[BaseModel]:
     """Create a wrapper model that customizes schema generation.
 
@@ -75,6 +141,10 @@ def _create_schema_wrapper(result_type: type[BaseModel], strip_description: bool
     duplication (LLM sees system prompt + schema, not system prompt + schema with
     same description repeated).
 
+    Wrappers are cached per (result_type, strip_description), so repeated
+    create_agent calls reuse one subclass instead of building a new one, and
+    each wrapper generates its stripped schema once per set of kwargs.
+
     Args:
         result_type: Original Pydantic model with docstring
         strip_description: If True, removes model-level description from schema
@@ -87,12 +157,19 @@ def _create_schema_wrapper(result_type: type[BaseModel], strip_description: bool
 
     # Create a model that overrides schema generation
     class SchemaWrapper(result_type):  # type: ignore
+        # Stripped schemas per set of kwargs; invariant for a given result_type
+        _schema_cache: ClassVar[dict[frozenset, dict[str, Any]]] = {}
+
         @classmethod
         def model_json_schema(cls, **kwargs):
-            schema = super().model_json_schema(**kwargs)
-            # Remove model-level description to avoid duplication with system prompt
-            schema.pop("description", None)
-            return schema
+            key = frozenset(kwargs.items())
+            schema = cls._schema_cache.get(key)
+            if schema is None:
+                schema = super().model_json_schema(**kwargs)
+                # Remove model-level description to avoid duplication with system prompt
+                schema.pop("description", None)
+                cls._schema_cache[key] = schema
+            return copy.deepcopy(schema)
 
     # Preserve the original model name for debugging
     SchemaWrapper.__name__ = result_type.__name__
@@ -189,70 +266,80 @@ async def _build_mcp_tools(tool_configs: list[dict[str, str]], context: AgentCon
         {"mcp_server": "percolate", "tool_name": "search_memory", "usage": "..."}
         -> Creates Tool from local search_memory function
     """
-    tools = []
-
-    # Group tools by MCP server
-    tools_by_server: dict[str, list[dict[str, str]]] = {}
+    tools_by_server = defaultdict(list)
     for tool_config in tool_configs:
-        server_name = tool_config["mcp_server"]
-        tools_by_server.setdefault(server_name, []).append(tool_config)
+        tools_by_server[tool_config["mcp_server"]].append(tool_config)
+
+    tools = []
 
     # Process each server
     for server_name, tool_config_list in tools_by_server.items():
         # "percolate", "default", or "demo" -> use local tools
-        if server_name in ("percolate", "default", "demo"):
-            server_tools = _build_local_tools(tool_config_list, context)
-            tools.extend(server_tools)
+        if server_name in _LOCAL_MCP_SERVERS:
+            tools.extend(_build_local_tools(tool_config_list, context))
         else:
             # Remote server -> not yet implemented
-            print(f"WARNING: Remote MCP server '{server_name}' not yet supported")
+            logger.warning("Remote MCP server '%s' not yet supported", server_name)
 
     return tools
 
 
-def _build_local_tools(tool_configs: list[dict[str, str]], context: AgentContext | None) -> list:
-    """Build Tool instances from local MCP tools.
+def _discover_local_tools() -> dict[str, Callable]:
+    """Import the local MCP tool functions that are available.
 
-    Uses create_pydantic_tool() to wrap MCP functions with explicit schema
-    and takes_ctx=False.
-
-    Args:
-        tool_configs: List of tool configurations
-        context: Agent context for database access
+    Pattern from carrier project: conditional imports to avoid hard dependencies.
+    Runs once at module import (add more tools as needed).
 
     Returns:
-        List of Tool instances
+        Dict of tool name to MCP tool function
     """
-    # Import MCP tools (add more as needed)
-    # Pattern from carrier project: conditional imports to avoid hard dependencies
-    mcp_tools = {}
+    mcp_tools: dict[str, Callable] = {}
 
     # Try to import demo MCP tools
     try:
         from mcp_tools import calculator
         mcp_tools["calculator"] = calculator
     except ImportError:
-        print("DEBUG: calculator tool not available")
+        logger.debug("calculator tool not available")
 
     try:
         from mcp_tools import get_weather
         mcp_tools["get_weather"] = get_weather
     except ImportError:
-        print("DEBUG: get_weather tool not available")
+        logger.debug("get_weather tool not available")
+
+    return mcp_tools
+
+
+_LOCAL_MCP_TOOLS = _discover_local_tools()
+
 
+def _build_local_tools(tool_configs: list[dict[str, str]], context: AgentContext | None) -> list:
+    """Build Tool instances from local MCP tools.
+
+    Uses create_pydantic_tool() to wrap MCP functions with explicit schema
+    and takes_ctx=False. Tool functions come from _LOCAL_MCP_TOOLS, which is
+    discovered once at import.
+
+    Args:
+        tool_configs: List of tool configurations
+        context: Agent context for database access
+
+    Returns:
+        List of Tool instances
+    """
     tools = []
 
     for tool_config in tool_configs:
         tool_name = tool_config["tool_name"]
 
-        if tool_name in mcp_tools:
-            mcp_tool_func = mcp_tools[tool_name]
-
+        mcp_tool_func = _LOCAL_MCP_TOOLS.get(tool_name)
+        if mcp_tool_func is not None:
             # Create Pydantic AI Tool instance with explicit schema
             tool = create_pydantic_tool(mcp_tool_func)
             tools.append(tool)
-            print(f"INFO: Built local tool: {tool_name}")
+            logger.info("Built local tool: %s", tool_name)
         else:
-            print(f"WARNING: Local tool '{tool_name}' not found in mcp_tools map")
+            logger.warning("Local tool '%s' not found in mcp_tools map", tool_name)
 
     return tools
@@ -11,13 +11,64 @@ Key features:
 - Agent similarity search via embeddings
 """
 
+import copy
 import json
+import os
 from pathlib import Path
 from typing import Any
 
 # TODO: Import percolate-rocks database once Python bindings are ready
 # from rem_db import Database
 
+# System agent-let directory: src/agents/registry.py → schema/agentlets/
+_SCHEMA_DIR = Path(__file__).resolve().parent.parent.parent / "schema" / "agentlets"
+
+# Rescan schema files on every load (dev only)
+_HOT_RELOAD = os.getenv("P8_AGENTLET_HOT_RELOAD", "").lower() in ("1", "true", "yes")
+
+
+def _parse_agentlet_dir() -> dict[str, dict[str, Any]]:
+    """Parse every system agent-let schema file in the schema directory.
+
+    Agent-lets are bundled with the package, so a file that is not valid JSON
+    is a packaging error and fails the import.
+
+    Returns:
+        Dict of agent-let name (filename without .json) to parsed schema
+
+    Raises:
+        ValueError: If a schema file is not valid JSON
+    """
+    schemas: dict[str, dict[str, Any]] = {}
+    if not _SCHEMA_DIR.is_dir():
+        return schemas
+
+    with os.scandir(_SCHEMA_DIR) as entries:
+        for entry in entries:
+            if not (entry.name.endswith(".json") and entry.is_file()):
+                continue
+            with open(entry.path, "rb") as f:
+                raw = f.read()
+            try:
+                schemas[entry.name[: -len(".json")]] = json.loads(raw)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid agent-let schema {entry.path}: {e}") from e
+
+    return schemas
+
+
+# System agent-lets are bundled and read-only: parse them once at import
+_AGENTLET_SCHEMAS = _parse_agentlet_dir()
+
+
+def reload_agentlet_index() -> None:
+    """Rescan and re-parse the system agent-let directory.
+
+    Use in development after adding, removing or editing schema files.
+    """
+    global _AGENTLET_SCHEMAS
+    _AGENTLET_SCHEMAS = _parse_agentlet_dir()
+
 
 def load_agentlet_schema(uri: str, tenant_id: str = "default", db_path: str | None = None) -> dict[str, Any]:
     """Load agent-let schema by URI from percolate-rocks or filesystem.
@@ -120,7 +171,9 @@ def _load_system_agentlet(uri: str) -> dict[str, Any]:
     System agent-lets are shipped with percolate-rocks in schema/agentlets/.
     These are available to all tenants and serve as templates.
 
-    Future optimization: Cache in percolate-rocks for faster lookups.
+    Schemas are parsed once at import; each call returns a deep copy that
+    callers are free to mutate. Set P8_AGENTLET_HOT_RELOAD=1 to pick up new
+    or edited schema files without restarting.
 
     Args:
         uri: System agent URI (e.g., 'researcher', 'system/classifier')
@@ -135,15 +188,16 @@ def _load_system_agentlet(uri: str) -> dict[str, Any]:
     if uri.startswith("system/"):
         uri = uri[7:]
 
-    # Construct path to schema file
-    schema_path = _get_system_agentlet_path(uri)
+    if _HOT_RELOAD:
+        reload_agentlet_index()
 
-    if not schema_path.exists():
-        raise FileNotFoundError(f"System agent-let not found: {uri} (path: {schema_path})")
+    schema = _AGENTLET_SCHEMAS.get(uri)
+    if schema is None:
+        raise FileNotFoundError(
+            f"System agent-let not found: {uri} (path: {_get_system_agentlet_path(uri)})"
+        )
 
-    # Load and return schema
-    with open(schema_path) as f:
-        return json.load(f)
+    return copy.deepcopy(schema)
 
 
 def _get_system_agentlet_path(uri: str) -> Path:
@@ -155,15 +209,7 @@ def _get_system_agentlet_path(uri: str) -> Path:
     Returns:
         Path to schema JSON file
     """
-    # Find schema directory relative to this file
-    # src/agents/registry.py → schema/agentlets/{uri}.json
-    current_file = Path(__file__)
-    project_root = current_file.parent.parent.parent  # Up 3 levels
-    schema_dir = project_root / "schema" / "agentlets"
-
-    # Normalize URI to filename
-    filename = f"{uri}.json"
-    return schema_dir / filename
+    return _SCHEMA_DIR / f"{uri}.json"
 
 
 # TODO: Add agent discovery functions once percolate-rocks bindings are ready
@@ -10,11 +10,13 @@ by stripping model-level descriptions when they match the system prompt.
 
 import inspect
 import json
+from functools import lru_cache
 from typing import Any, Callable, get_type_hints
 
 from pydantic_ai.tools import Tool
 
 
+@lru_cache(maxsize=None)
 def create_pydantic_tool(mcp_tool_func: Callable) -> Tool:
     """Create a Pydantic AI Tool instance from an MCP tool function.
 
@@ -24,6 +26,9 @@ def create_pydantic_tool(mcp_tool_func: Callable) -> Tool:
     Note: MCP tools expect a Context parameter which we pass as None. The tool's
     docstring becomes the description in the LLM prompt.
 
+    Results are cached per function: Tool instances hold no per-run state, so
+    agents can share them instead of re-introspecting the signature each time.
+
     Args:
         mcp_tool_func: The original MCP tool function (with ctx parameter)
 
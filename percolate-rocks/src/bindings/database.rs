@@ -4,9 +4,21 @@ use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 use crate::database::Database as RustDatabase;
 use crate::types::Entity;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 use std::path::PathBuf;
 
+/// Tokio runtime shared by the blocking bindings.
+///
+/// Created on first use and kept for the life of the process, so each call
+/// avoids spinning up worker threads, and HTTP clients keep their pooled
+/// keep-alive connections between calls.
+fn runtime() -> &'static tokio::runtime::Runtime {
+    static RUNTIME: OnceLock<tokio::runtime::Runtime> = OnceLock::new();
+    RUNTIME.get_or_init(|| {
+        tokio::runtime::Runtime::new().expect("Failed to create tokio runtime")
+    })
+}
+
 /// Get default database path from environment or home directory.
 ///
 /// Resolution order:
@@ -108,24 +120,35 @@ pub struct PyDatabase {
 
 #[pymethods]
 impl PyDatabase {
-    /// Create new database using defaults.
+    /// Create new database, using defaults for omitted arguments.
     ///
     /// Path resolution:
-    /// 1. P8_DB_PATH environment variable
-    /// 2. P8_HOME/db environment variable
-    /// 3. ~/.p8/db (default)
+    /// 1. `db_path` argument
+    /// 2. P8_DB_PATH environment variable
+    /// 3. P8_HOME/db environment variable
+    /// 4. ~/.p8/db (default)
     ///
     /// Tenant ID resolution:
-    /// 1. P8_TENANT_ID environment variable
-    /// 2. "default" (single-user mode)
+    /// 1. `tenant_id` argument
+    /// 2. P8_TENANT_ID environment variable
+    /// 3. "default" (single-user mode)
+    ///
+    /// # Arguments
+    ///
+    /// * `db_path` - Database directory (`~` is expanded)
+    /// * `tenant_id` - Tenant identifier for isolation
     ///
     /// # Returns
     ///
     /// New `PyDatabase` instance
     #[new]
-    fn new() -> PyResult<Self> {
-        let path = get_default_db_path();
-        let tenant_id = get_tenant_id();
+    #[pyo3(signature = (db_path=None, tenant_id=None))]
+    fn new(db_path: Option<String>, tenant_id: Option<String>) -> PyResult<Self> {
+        let path = match db_path {
+            Some(p) => PathBuf::from(shellexpand::tilde(&p).to_string()),
+            None => get_default_db_path(),
+        };
+        let tenant_id = tenant_id.unwrap_or_else(get_tenant_id);
 
         let db = RustDatabase::open(&path)
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Failed to open database: {}", e)))?;
@@ -390,8 +413,7 @@ impl PyDatabase {
         let tenant_id = self.tenant_id.clone();
 
         let results = py.allow_threads(|| {
-            tokio::runtime::Runtime::new()
-                .unwrap()
+            runtime()
                 .block_on(async {
                     inner.search(&tenant_id, &schema, &query, top_k).await
                 })
@@ -467,8 +489,7 @@ impl PyDatabase {
         let schema_hint_clone = schema_hint.clone();
 
         let result = py.allow_threads(|| {
-            tokio::runtime::Runtime::new()
-                .unwrap()
+            runtime()
                 .block_on(async {
                     let plan = builder.plan_query(&question, &schema_context).await?;
 
@@ -567,8 +588,7 @@ impl PyDatabase {
 
         // Generate plan asynchronously
         let result: serde_json::Value = py.allow_threads(|| -> crate::types::Result<serde_json::Value> {
-            tokio::runtime::Runtime::new()
-                .unwrap()
+            runtime()
                 .block_on(async {
                     let plan = builder.plan_query(&question, &context).await?;
                     Ok(serde_json::to_value(&plan)?)
@@ -641,8 +661,7 @@ impl PyDatabase {
 
         // Extract edges asynchronously
         let result: serde_json::Value = py.allow_threads(|| -> crate::types::Result<serde_json::Value> {
-            tokio::runtime::Runtime::new()
-                .unwrap()
+            runtime()
                 .block_on(async {
                     let plan = builder.extract_edges(&content, context.as_deref()).await?;
                     Ok(serde_json::to_value(&plan)?)
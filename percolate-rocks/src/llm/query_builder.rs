@@ -5,6 +5,26 @@ use crate::llm::planner::{QueryPlan, QueryType, Query, QueryDialect, ExecutionMo
 use serde::Deserialize;
 use serde_json::json;
 use reqwest::Client;
+use std::sync::OnceLock;
+use std::time::Duration;
+
+/// Shared HTTP client for LLM calls.
+///
+/// `reqwest::Client` holds a keep-alive connection pool, so reusing one
+/// client skips the TCP + TLS handshake on repeat calls to the same provider.
+/// Clones share the pool. Callers must drive it from a long-lived runtime
+/// (pooled connections belong to the runtime that opened them).
+fn shared_http_client() -> Client {
+    static CLIENT: OnceLock<Client> = OnceLock::new();
+    CLIENT
+        .get_or_init(|| {
+            Client::builder()
+                .pool_idle_timeout(Duration::from_secs(90))
+                .build()
+                .expect("Failed to create HTTP client")
+        })
+        .clone()
+}
 
 /// LLM provider type.
 #[derive(Debug, Clone)]
@@ -99,7 +119,7 @@ impl LlmQueryBuilder {
             api_key,
             model,
             provider,
-            client: Client::new(),
+            client: shared_http_client(),
         }
     }
 
@@ -0,0 +1,19 @@
+"""Shared fixtures for percolate-rocks Python tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def shared_db(tmp_path_factory):
+    """One Database in a temporary directory, opened once per test session.
+
+    Opening RocksDB (column family discovery, WAL replay, block cache setup)
+    is the expensive part of most fixtures, so modules that only add entities
+    under fresh UUIDs share this instance. Register schemas in a module
+    fixture; registration is idempotent.
+    """
+    from rem_db import Database
+
+    db_path = tmp_path_factory.mktemp("rem_db")
+    return Database(db_path=str(db_path), tenant_id="test")
+
@@ -0,0 +1,29 @@
+"""Shared fixtures for agent framework integration tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def agent_cache():
+    """Create agents once per (tenant, schema URI, model override) for the session.
+
+    Agents hold no per-run state, so tests that only build an agent from a
+    schema URI (and inspect or run it) can share one instance. Tests that pass
+    agent_schema_override should call create_agent directly.
+
+    Usage:
+        agent = await agent_cache(ctx)
+        agent = await agent_cache(ctx, model_override="claude-opus-4")
+    """
+    # Imported lazily: test modules put src/ on sys.path at collection
+    from agents import create_agent
+
+    cache = {}
+
+    async def get(ctx, model_override=None):
+        key = (ctx.tenant_id, ctx.agent_schema_uri, model_override)
+        if key not in cache:
+            cache[key] = await create_agent(ctx, model_override=model_override)
+        return cache[key]
+
+    return get
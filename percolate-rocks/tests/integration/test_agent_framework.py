@@ -12,6 +12,7 @@ Run with: pytest tests/integration/test_agent_framework.py -v
 import asyncio
 import sys
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
@@ -20,6 +21,16 @@ sys.path.append(str(Path(__file__).parent.parent.parent / "src"))
 
 from agents import AgentContext, create_agent, load_agentlet_schema
 
+# Request headers for context parsing tests (read-only, shared across tests)
+_TEST_HEADERS = MappingProxyType({
+    "X-User-ID": "user-123",
+    "X-Session-ID": "session-abc",
+    "X-Device-ID": "device-xyz",
+    "X-Model-Name": "claude-opus-4",
+    "X-Agent-Schema": "researcher",
+    "X-DB-Path": "/custom/db/path",
+})
+
 
 class TestAgentLoading:
     """Test agent schema loading from filesystem and database."""
@@ -59,16 +70,7 @@ class TestAgentContext:
 
     def test_context_from_headers(self):
         """Extract context from HTTP headers."""
-        headers = {
-            "X-User-ID": "user-123",
-            "X-Session-ID": "session-abc",
-            "X-Device-ID": "device-xyz",
-            "X-Model-Name": "claude-opus-4",
-            "X-Agent-Schema": "researcher",
-            "X-DB-Path": "/custom/db/path",
-        }
-
-        ctx = AgentContext.from_headers(headers, tenant_id="tenant-456")
+        ctx = AgentContext.from_headers(_TEST_HEADERS, tenant_id="tenant-456")
 
         assert ctx.user_id == "user-123"
         assert ctx.session_id == "session-abc"
@@ -78,6 +80,17 @@ class TestAgentContext:
         assert ctx.agent_schema_uri == "researcher"
         assert ctx.db_path == "/custom/db/path"
 
+    def test_context_from_headers_is_cached(self):
+        """Same mapped header values reuse one immutable context."""
+        first = AgentContext.from_headers({**_TEST_HEADERS, "X-Request-ID": "1"}, tenant_id="tenant-456")
+        second = AgentContext.from_headers({**_TEST_HEADERS, "X-Request-ID": "2"}, tenant_id="tenant-456")
+        other_tenant = AgentContext.from_headers(_TEST_HEADERS, tenant_id="tenant-789")
+
+        assert first is second
+        assert other_tenant is not first
+        with pytest.raises(ValueError):
+            first.user_id = "someone-else"
+
     def test_context_defaults(self):
         """Context should have sensible defaults."""
         ctx = AgentContext(tenant_id="tenant-123")
@@ -111,14 +124,14 @@ class TestAgentFactory:
         assert agent is not None
         assert agent.system_prompt == "You are a helpful assistant."
 
-    async def test_create_agent_from_context_uri(self):
+    async def test_create_agent_from_context_uri(self, agent_cache):
         """Create agent from context.agent_schema_uri."""
         ctx = AgentContext(
             tenant_id="default",
             agent_schema_uri="test-agent"
         )
 
-        agent = await create_agent(ctx)
+        agent = await agent_cache(ctx)
 
         assert agent is not None
         assert "test agent" in agent.system_prompt.lower()
@@ -149,14 +162,14 @@ class TestAgentExecution:
     2. Run: pytest tests/integration/test_agent_framework.py::TestAgentExecution -v
     """
 
-    async def test_execute_test_agent(self):
+    async def test_execute_test_agent(self, agent_cache):
         """Execute test-agent with a simple question."""
         ctx = AgentContext(
             tenant_id="default",
             agent_schema_uri="test-agent"
         )
 
-        agent = await create_agent(ctx)
+        agent = await agent_cache(ctx)
         result = await agent.run("What is 2 + 2?")
 
         # Check structured output
@@ -172,14 +185,14 @@ class TestAgentExecution:
         assert 0.0 <= result.data.confidence <= 1.0
         assert isinstance(result.data.tags, list)
 
-    async def test_execute_researcher_agent(self):
+    async def test_execute_researcher_agent(self, agent_cache):
         """Execute researcher agent (will fail on tool calls until MCP tools implemented)."""
         ctx = AgentContext(
             tenant_id="default",
             agent_schema_uri="researcher"
         )
 
-        agent = await create_agent(ctx)
+        agent = await agent_cache(ctx)
 
         # This will likely fail when it tries to call search_memory tool
         # since MCP tools are not yet implemented
@@ -0,0 +1,263 @@
+"""Test Pydantic model helpers (no database required)."""
+
+import json
+import warnings
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
+
+from rem_db.models import (
+    ChatMessage,
+    ChatSession,
+    ExportConfig,
+    Job,
+    JobStatus,
+    JobType,
+    WalEntry,
+)
+
+
+def test_from_trusted_row_parses_timestamps():
+    """Trusted rows parse ISO 8601 timestamps and ignore non-field keys."""
+    session = ChatSession.from_trusted_row(
+        {
+            "session_id": "s-1",
+            "tenant_id": "t-1",
+            "message_count": 2,
+            "metadata": {},
+            "created_at": "2025-10-26T14:30:00.123456Z",
+            "updated_at": "2025-10-26T14:31:00Z",
+            "id": "system-field-not-on-model",
+        }
+    )
+
+    assert session.created_at == datetime(2025, 10, 26, 14, 30, 0, 123456, tzinfo=timezone.utc)
+    assert session.updated_at.tzinfo is not None
+    assert session.agent_uri is None
+    assert "id" not in session.model_fields_set
+    assert session.model_fields_set == {
+        "session_id", "tenant_id", "message_count", "metadata", "created_at", "updated_at"
+    }
+
+
+def test_from_trusted_row_matches_validated_model():
+    """Hydrated messages compare equal to fully validated ones."""
+    row = {
+        "message_id": "m-1",
+        "session_id": "s-1",
+        "tenant_id": "t-1",
+        "role": "user",
+        "content": "Hello",
+        "timestamp": "2025-10-26T14:30:00Z",
+        "usage": {"total_tokens": 3},
+    }
+
+    assert ChatMessage.from_trusted_row(row) == ChatMessage.model_validate(row)
+
+
+def test_from_trusted_row_loads_rows_predating_constraints():
+    """Stored rows are not re-validated, so legacy trace IDs and roles still load."""
+    message = ChatMessage.from_trusted_row(
+        {
+            "message_id": "m-1",
+            "session_id": "s-1",
+            "tenant_id": "t-1",
+            "role": "function",
+            "content": "Hello",
+            "timestamp": "2025-10-26T14:30:00Z",
+            "trace_id": "legacy-trace",
+            "span_id": "legacy-span",
+        }
+    )
+
+    assert (message.role, message.trace_id, message.span_id) == (
+        "function", "legacy-trace", "legacy-span"
+    )
+    assert message.timestamp.tzinfo is not None
+
+
+def test_from_trusted_row_parses_uuids_and_enums():
+    """UUID and enum fields stored as text come back typed, like validated models."""
+    row = {
+        "job_id": "6ba7b810-9dad-11d1-80b4-00c04fd430c8",
+        "job_type": "embedding",
+        "status": "pending",
+        "tenant_id": "t-1",
+        "created_at": "2025-10-26T14:30:00Z",
+    }
+
+    job = Job.from_trusted_row(row)
+
+    assert job.job_id == UUID(row["job_id"])
+    assert (job.job_type, job.status) == (JobType.EMBEDDING, JobStatus.PENDING)
+    assert job == Job.model_validate(row)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        job.model_dump_json()
+
+
+def test_from_trusted_row_parses_wal_entity_id():
+    """WAL entries get a UUID entity_id and typed timestamp."""
+    entry = WalEntry.from_trusted_row(
+        {
+            "sequence": 7,
+            "entity_id": "550e8400-e29b-41d4-a716-446655440000",
+            "timestamp": "2025-10-26T14:30:00Z",
+            "tenant_id": "t-1",
+            "operation": "insert",
+            "entity_type": "resources",
+        }
+    )
+
+    assert isinstance(entry.entity_id, UUID)
+    assert entry.timestamp.tzinfo is not None
+
+
+def test_batch_loaders_accept_rows_predating_constraints():
+    """One legacy row doesn't fail a batch (rows are not re-validated)."""
+    rows = [
+        {
+            "message_id": f"m-{i}",
+            "session_id": "s-1",
+            "tenant_id": "t-1",
+            "role": role,
+            "content": "Hello",
+            "timestamp": "2025-10-26T14:30:00Z",
+            "trace_id": trace_id,
+        }
+        for i, (role, trace_id) in enumerate([("user", None), ("function", "abc")])
+    ]
+
+    messages = ChatMessage.from_trusted_rows(rows)
+
+    assert [(m.role, m.trace_id) for m in messages] == [("user", None), ("function", "abc")]
+    assert ChatMessage.from_trusted_json(json.dumps(rows)) == messages
+
+
+def test_from_trusted_rows_preserves_order():
+    """Batch hydration returns one message per row, in order."""
+    rows = [
+        {
+            "message_id": f"m-{i}",
+            "session_id": "s-1",
+            "tenant_id": "t-1",
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": f"message {i}",
+            "timestamp": f"2025-10-26T14:30:0{i}Z",
+        }
+        for i in range(3)
+    ]
+
+    messages = ChatMessage.from_trusted_rows(rows)
+
+    assert [m.message_id for m in messages] == ["m-0", "m-1", "m-2"]
+    assert all(isinstance(m.timestamp, datetime) for m in messages)
+    assert ChatMessage.from_trusted_rows(iter(rows)) == messages
+    assert ChatMessage.from_trusted_json(json.dumps(rows).encode()) == messages
+
+
+def test_model_json_schema_is_cached_per_class():
+    """Default schemas are generated once and returned as independent copies."""
+    first = ChatMessage.model_json_schema()
+    first.pop("description")
+
+    assert "description" in ChatMessage.model_json_schema()
+    assert ChatMessage.model_json_schema() == ChatMessage.model_json_schema()
+    assert ChatSession.model_json_schema()["title"] == "ChatSession"
+
+
+def test_chat_models_are_frozen():
+    """Chat messages loaded from the database cannot be mutated."""
+    message = ChatMessage.from_trusted_row(
+        {
+            "message_id": "m-1",
+            "session_id": "s-1",
+            "tenant_id": "t-1",
+            "role": "user",
+            "content": "Hello",
+            "timestamp": "2025-10-26T14:30:00Z",
+        }
+    )
+
+    with pytest.raises(ValidationError):
+        message.content = "changed"
+
+
+def test_trace_ids_must_be_hex_of_fixed_length():
+    """OTEL trace/span IDs are validated on ingress."""
+    fields = {
+        "message_id": "m-1",
+        "session_id": "s-1",
+        "tenant_id": "t-1",
+        "role": "assistant",
+        "content": "Hi",
+        "timestamp": "2025-10-26T14:30:00Z",
+    }
+
+    message = ChatMessage(**fields, trace_id="0af7651916cd43dd8448eb211c80319c", span_id="b7ad6b7169203331")
+    assert message.span_id == "b7ad6b7169203331"
+
+    with pytest.raises(ValidationError):
+        ChatMessage(**fields, trace_id="not-a-trace-id")
+    with pytest.raises(ValidationError):
+        ChatMessage(**fields, span_id="b7ad6b71692033")
+
+
+def test_low_cardinality_strings_are_interned():
+    """Role and tenant strings from separate rows share one object."""
+    rows = [
+        {
+            "message_id": f"m-{i}",
+            "session_id": "s-1",
+            "tenant_id": "".join(["tenant-", "abc"]),
+            "role": "".join(["assi", "stant"]),
+            "content": "Hi",
+            "timestamp": "2025-10-26T14:30:00Z",
+        }
+        for i in range(2)
+    ]
+
+    first, second = ChatMessage.from_trusted_rows(rows)
+    validated = ChatMessage.model_validate(rows[0])
+
+    assert first.role is second.role is validated.role
+    assert first.tenant_id is second.tenant_id is validated.tenant_id
+
+    trusted = ChatMessage.from_trusted_row(dict(rows[0], tenant_id="".join(["tenant-", "abc"])))
+    assert trusted.tenant_id is first.tenant_id
+
+
+def test_message_role_is_closed_vocabulary():
+    """Unknown roles are rejected on ingress."""
+    with pytest.raises(ValidationError):
+        ChatMessage(
+            message_id="m-1",
+            session_id="s-1",
+            tenant_id="t-1",
+            role="narrator",
+            content="Once upon a time",
+            timestamp="2025-10-26T14:30:00Z",
+        )
+
+
+def test_table_metadata_classvars_are_published_in_schema():
+    """ClassVar table metadata is what the database sees in the JSON schema."""
+    schema = ChatMessage.model_json_schema()
+
+    assert schema["indexed_fields"] == list(ChatMessage.INDEXED_FIELDS)
+    assert schema["key_field"] == ChatMessage.KEY_FIELD == "message_id"
+    assert schema["short_name"] == "messages"
+    assert ChatSession.model_json_schema()["embedding_fields"] == []
+    assert "INDEXED_FIELDS" not in ChatMessage.model_fields
+
+
+def test_export_compression_is_closed_vocabulary():
+    """Unknown codecs are rejected."""
+    config = ExportConfig(format="parquet", output_path="/tmp/out.parquet")
+    assert config.compression == "zstd"
+    assert ExportConfig(format="parquet", output_path="o", compression=None).compression is None
+
+    with pytest.raises(ValidationError):
+        ExportConfig(format="parquet", output_path="o", compression="brotli")
@@ -1,4 +1,8 @@
-"""Test upsert functionality with Pydantic model collections."""
+"""Test upsert functionality with Pydantic model collections.
+
+Tests share one database per session (per worker under pytest-xdist) and
+write disjoint keys, so the module can run in parallel: `pytest -n auto`.
+"""
 
 import json
 import pytest
@@ -6,28 +10,18 @@ from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
 
 
-@pytest.fixture
-def db(tmp_path, monkeypatch):
-    """Create Database with environment configuration."""
-    # Set environment variables for test database
-    db_path = tmp_path / "test_db"
-    db_path.mkdir()
-
-    monkeypatch.setenv("P8_DB_PATH", str(db_path))
-    monkeypatch.setenv("P8_TENANT_ID", "test")
-
-    # Import after environment is set
-    from rem_db import Database
+@pytest.fixture(scope="session")
+def db(shared_db):
+    """Shared session Database with the Session and Resource schemas registered.
 
-    db = Database()
-
-    # Register Session schema - convert to JSON string
-    db.register_schema("Session", json.dumps(Session.model_json_schema()))
-
-    # Register Resource schema - convert to JSON string
-    db.register_schema("Resource", json.dumps(Resource.model_json_schema()))
+    Tests only add entities with fresh UUIDs and never depend on the database
+    being empty, so they can share it.
+    """
+    # Register Session and Resource schemas (JSON built once at import)
+    shared_db.register_schema("Session", _SESSION_SCHEMA_JSON)
+    shared_db.register_schema("Resource", _RESOURCE_SCHEMA_JSON)
 
-    return db
+    return shared_db
 
 
 class Session(BaseModel):
@@ -67,13 +61,24 @@ class Resource(BaseModel):
     )
 
 
-def test_upsert_sessions(db):
+@pytest.fixture
+def ns(request):
+    """Per-test key prefix, so tests sharing the database never write the same key."""
+    return request.node.name
+
+
+# Schema JSON strings passed to register_schema
+_SESSION_SCHEMA_JSON = json.dumps(Session.model_json_schema())
+_RESOURCE_SCHEMA_JSON = json.dumps(Resource.model_json_schema())
+
+
+def test_upsert_sessions(db, ns):
     """Test upserting a collection of Session models."""
     # Create collection of sessions
     sessions = [
-        Session(session_id="s1", user_id="u1", start_time="2025-10-26T10:00:00Z"),
-        Session(session_id="s2", user_id="u1", start_time="2025-10-26T11:00:00Z"),
-        Session(session_id="s3", user_id="u2", start_time="2025-10-26T12:00:00Z"),
+        Session(session_id=f"{ns}-s1", user_id="u1", start_time="2025-10-26T10:00:00Z"),
+        Session(session_id=f"{ns}-s2", user_id="u1", start_time="2025-10-26T11:00:00Z"),
+        Session(session_id=f"{ns}-s3", user_id="u2", start_time="2025-10-26T12:00:00Z"),
     ]
 
     # Upsert sessions - pass model instances directly
@@ -83,9 +88,8 @@ def test_upsert_sessions(db):
     assert len(uuids) == 3
     assert all(isinstance(uuid, str) for uuid in uuids)
 
-    # Verify each session can be retrieved
-    for uuid in uuids:
-        entity = db.get(uuid)
+    # Verify each session can be retrieved (one multi_get round trip)
+    for entity in db.get_batch(uuids):
         assert entity is not None
         assert "session_id" in entity
         assert "user_id" in entity
@@ -119,9 +123,8 @@ def test_upsert_resources(db):
     assert len(uuids) == 3
     assert all(isinstance(uuid, str) for uuid in uuids)
 
-    # Verify each resource can be retrieved
-    for uuid in uuids:
-        entity = db.get(uuid)
+    # Verify each resource can be retrieved (one multi_get round trip)
+    for entity in db.get_batch(uuids):
         assert entity is not None
         assert "name" in entity
         assert "content" in entity
@@ -157,13 +160,13 @@ def test_upsert_idempotency(db):
     assert entity is not None
 
 
-def test_upsert_mixed_models(db):
+def test_upsert_mixed_models(db, ns):
     """Test upserting mixed model types in single call."""
     # Create mixed collection - pass model instances directly
     models = [
-        Session(session_id="s1", user_id="u1", start_time="2025-10-26T10:00:00Z"),
+        Session(session_id=f"{ns}-s1", user_id="u1", start_time="2025-10-26T10:00:00Z"),
         Resource(name="Doc", content="Content", uri="https://example.com"),
-        Session(session_id="s2", user_id="u2", start_time="2025-10-26T11:00:00Z"),
+        Session(session_id=f"{ns}-s2", user_id="u2", start_time="2025-10-26T11:00:00Z"),
     ]
 
     # Upsert mixed models
@@ -173,13 +176,9 @@ def test_upsert_mixed_models(db):
     assert len(uuids) == 3
 
     # Verify entity types are correct by checking fields
-    entity1 = db.get(uuids[0])
+    entity1, entity2, entity3 = db.get_batch(uuids)
     assert "session_id" in entity1 and "user_id" in entity1
-
-    entity2 = db.get(uuids[1])
     assert "name" in entity2 and "uri" in entity2
-
-    entity3 = db.get(uuids[2])
     assert "session_id" in entity3 and "user_id" in entity3
 
 
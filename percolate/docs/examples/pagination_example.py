@@ -2,15 +2,28 @@
 
 This example demonstrates how to use the paginated_request function
 to handle inputs that exceed model context windows.
+
+Set P8_LLM_CACHE=1 to cache chunk responses on disk (~/.p8/llm_cache) so
+re-runs during development replay them instead of calling the LLM.
 """
 
 import asyncio
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
 
 from pydantic import BaseModel, Field
+from pydantic_ai import Agent
 
 from percolate.agents.context import AgentContext
-from percolate.agents.factory import paginated_request
-from percolate.agents.pagination import PaginationConfig
+from percolate.agents.factory import create_agent
+from percolate.agents.pagination import PaginationConfig, paginated_request
+
+MODEL = "claude-haiku-4-5"
+LLM_CACHE_DIR = Path.home() / ".p8" / "llm_cache"
 
 
 class EntityExtractor(BaseModel):
@@ -61,31 +74,87 @@ SENTIMENT_SCHEMA = {
     "required": ["sentiment", "score", "key_themes"],
 }
 
+@dataclass
+class CachedRunResult:
+    """Stand-in for an agent run result replayed from the cache."""
 
-async def example_merge_strategy():
-    """Example: Using merge strategy to combine list fields across chunks."""
-    print("\n=== Example 1: Merge Strategy ===")
+    output: Any
+
+
+class CachedAgent:
+    """Agent wrapper that caches structured outputs on disk (development only).
+
+    Entries are keyed by sha256 of the model, the agent schema and the chunk
+    prompt, and stored as JSON. Only run() is proxied, which is all that
+    paginated_request uses.
+    """
+
+    def __init__(self, agent: Agent, schema: dict[str, Any], result_type: type[BaseModel]):
+        self.agent = agent
+        self.result_type = result_type
+        self._key_prefix = f"{MODEL}\0{json.dumps(schema, sort_keys=True)}\0"
+        LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    async def run(self, prompt: str | list[str]) -> Any:
+        # Chunks with metadata arrive as [part marker, chunk] content parts
+        text = prompt if isinstance(prompt, str) else "\0".join(prompt)
+        key = hashlib.sha256((self._key_prefix + text).encode()).hexdigest()
+        path = LLM_CACHE_DIR / f"{key}.json"
+        if path.exists():
+            return CachedRunResult(self.result_type.model_validate_json(path.read_bytes()))
 
-    # Simulate large document (in practice, this would be 100k+ tokens)
-    large_document = """
+        result = await self.agent.run(prompt)
+        path.write_text(result.output.model_dump_json())
+        return result
+
+
+async def create_example_agent(schema: dict[str, Any], result_type: type[BaseModel]) -> Agent | CachedAgent:
+    """Create an agent for the given schema, cached on disk if P8_LLM_CACHE=1."""
+    agent = await create_agent(
+        context=AgentContext(tenant_id="user-123"),
+        agent_schema_override=schema,
+        result_type=result_type,
+        model_override=MODEL,
+    )
+    if os.environ.get("P8_LLM_CACHE") == "1":
+        return CachedAgent(agent, schema, result_type)
+    return agent
+
+
+# Sample inputs, built once at import rather than on every example run.
+
+# Simulate large document (in practice, this would be 100k+ tokens)
+_LARGE_DOCUMENT = """
     Apple and Google announced a partnership today.
     Microsoft is also joining the initiative.
     Amazon and Tesla are competitors in this space.
     IBM has been in the industry for decades.
     """ * 100  # Repeat to simulate large content
 
-    context = AgentContext(tenant_id="user-123", default_model="claude-haiku-4-5")
+# Same companies in different casings (for the deduplicating merge)
+_MIXED_CASE_DOCUMENT = """
+    Apple and apple are the same company.
+    Google and GOOGLE refer to the same entity.
+    Microsoft, microsoft, and MICROSOFT are identical.
+    """ * 100
+
+_SAMPLE_TEXT = "Sample text " * 1000  # Large content
+
+
+async def example_merge_strategy():
+    """Example: Using merge strategy to combine list fields across chunks."""
+    print("\n=== Example 1: Merge Strategy ===")
+
+    agent = await create_example_agent(ENTITY_EXTRACTOR_SCHEMA, EntityExtractor)
 
     result = await paginated_request(
-        prompt="Extract all company names from this document",
-        content=large_document,
-        context=context,
-        agent_schema_override=ENTITY_EXTRACTOR_SCHEMA,
-        result_type=EntityExtractor,
-        pagination_config=PaginationConfig(
+        agent=agent,
+        content=_LARGE_DOCUMENT,
+        config=PaginationConfig(
             merge_strategy="merge",  # Combine entities from all chunks
             chunk_size=500,  # Small chunks to demonstrate pagination
             parallel=True,  # Process chunks in parallel
+            max_concurrent=4,  # At most 4 chunk requests in flight
         ),
     )
 
@@ -104,15 +173,12 @@ async def example_concat_strategy():
         {"id": 3, "text": "It's okay, nothing special."},
     ] * 50  # Simulate large dataset
 
-    context = AgentContext(tenant_id="user-123", default_model="claude-haiku-4-5")
+    agent = await create_example_agent(SENTIMENT_SCHEMA, SentimentAnalysis)
 
     results = await paginated_request(
-        prompt="Analyze sentiment for each batch of reviews",
+        agent=agent,
         content=records,
-        context=context,
-        agent_schema_override=SENTIMENT_SCHEMA,
-        result_type=SentimentAnalysis,
-        pagination_config=PaginationConfig(
+        config=PaginationConfig(
             merge_strategy="concat",  # Return list of results (one per chunk)
             chunk_size=20,  # 20 records per chunk
         ),
@@ -129,15 +195,12 @@ async def example_custom_merge():
 
     def deduplicate_entities(results):
         """Custom merge that deduplicates entities by name."""
-        seen = set()
-        merged_entities = []
-
+        # First spelling wins; dicts preserve insertion order
+        by_name: dict[str, str] = {}
         for result in results:
             for entity in result.entities:
-                entity_lower = entity.lower()
-                if entity_lower not in seen:
-                    seen.add(entity_lower)
-                    merged_entities.append(entity)
+                by_name.setdefault(entity.lower(), entity)
+        merged_entities = list(by_name.values())
 
         return EntityExtractor(
             entities=merged_entities,
@@ -145,21 +208,12 @@ async def example_custom_merge():
             summary=f"Merged {len(results)} chunks with deduplication",
         )
 
-    content = """
-    Apple and apple are the same company.
-    Google and GOOGLE refer to the same entity.
-    Microsoft, microsoft, and MICROSOFT are identical.
-    """ * 100
-
-    context = AgentContext(tenant_id="user-123", default_model="claude-haiku-4-5")
+    agent = await create_example_agent(ENTITY_EXTRACTOR_SCHEMA, EntityExtractor)
 
     result = await paginated_request(
-        prompt="Extract company names",
-        content=content,
-        context=context,
-        agent_schema_override=ENTITY_EXTRACTOR_SCHEMA,
-        result_type=EntityExtractor,
-        pagination_config=PaginationConfig(
+        agent=agent,
+        content=_MIXED_CASE_DOCUMENT,
+        config=PaginationConfig(
             merge_strategy="custom",
             custom_merge_fn=deduplicate_entities,
             chunk_size=300,
@@ -174,17 +228,12 @@ async def example_sequential_processing():
     """Example: Sequential processing for rate limit safety."""
     print("\n=== Example 4: Sequential Processing ===")
 
-    content = "Sample text " * 1000  # Large content
-
-    context = AgentContext(tenant_id="user-123", default_model="claude-haiku-4-5")
+    agent = await create_example_agent(ENTITY_EXTRACTOR_SCHEMA, EntityExtractor)
 
     result = await paginated_request(
-        prompt="Extract entities",
-        content=content,
-        context=context,
-        agent_schema_override=ENTITY_EXTRACTOR_SCHEMA,
-        result_type=EntityExtractor,
-        pagination_config=PaginationConfig(
+        agent=agent,
+        content=_SAMPLE_TEXT,
+        config=PaginationConfig(
             merge_strategy="merge",
             parallel=False,  # Process sequentially (safer for rate limits)
             chunk_size=500,
@@ -203,18 +252,25 @@ async def main():
     # Note: These examples require API keys for LLM providers
     # Set ANTHROPIC_API_KEY environment variable before running
 
-    try:
-        await example_merge_strategy()
-        await example_concat_strategy()
-        await example_custom_merge()
-        await example_sequential_processing()
-
-        print("\n" + "=" * 50)
-        print("All examples completed successfully!")
+    # The examples share no state and are bound by LLM latency, so run them
+    # concurrently (each prints its own banner; output may interleave)
+    results = await asyncio.gather(
+        example_merge_strategy(),
+        example_concat_strategy(),
+        example_custom_merge(),
+        example_sequential_processing(),
+        return_exceptions=True,
+    )
 
-    except Exception as e:
+    errors = [r for r in results if isinstance(r, Exception)]
+    for e in errors:
         print(f"\nError: {e}")
+
+    print("\n" + "=" * 50)
+    if errors:
         print("Make sure to set ANTHROPIC_API_KEY environment variable")
+    else:
+        print("All examples completed successfully!")
 
 
 if __name__ == "__main__":
@@ -9,6 +9,14 @@ Key patterns from carrier reference:
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import hashlib
+import importlib
+import weakref
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable
+from functools import cache
 from typing import Any
 
 from json_schema_to_pydantic import PydanticModelBuilder
@@ -26,6 +34,35 @@ from percolate.otel import (
     setup_instrumentation,
 )
 from percolate.settings import settings
+from percolate.utils.serialization import json_dumps_canonical
+
+# Set once setup_instrumentation() has returned (it raises on failure), so
+# later create_agent calls skip it entirely
+_instrumentation_ready = False
+
+# Dynamic models keyed by a digest of the canonical agent schema (LRU-bounded,
+# schemas come from many tenants)
+_MODEL_CACHE: OrderedDict[str, type[BaseModel]] = OrderedDict()
+_MODEL_CACHE_SIZE = 256
+
+# Description-stripping wrapper per result type (weak keys, like pagination's
+# output schema digests). Values are weak too: a wrapper subclasses its key,
+# so a strong value would keep evicted dynamic models alive. Wrappers live as
+# long as the agents built on them.
+_SCHEMA_WRAPPERS: weakref.WeakKeyDictionary[type[BaseModel], weakref.ref[type[BaseModel]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Agents keyed by (schema digest, model name, result_type, strip flag).
+# Pydantic AI agents hold no per-run state, so one instance serves every
+# request for the same agent-let.
+_AGENT_CACHE: OrderedDict[tuple, Agent] = OrderedDict()
+_AGENT_CACHE_SIZE = 128
+
+
+def _schema_digest(agent_schema: dict[str, Any]) -> str:
+    """Digest of an agent schema that ignores key order."""
+    return hashlib.blake2b(json_dumps_canonical(agent_schema), digest_size=16).hexdigest()
 
 
 def _create_model_from_schema(agent_schema: dict[str, Any]) -> type[BaseModel]:
@@ -38,6 +75,9 @@ def _create_model_from_schema(agent_schema: dict[str, Any]) -> type[BaseModel]:
     - Field descriptions and constraints
     - Recursive schema definitions
 
+    Models are cached by schema digest, so repeated calls with an identical
+    schema return the same class.
+
     Args:
         agent_schema: Agent schema dict (JSON Schema format)
 
@@ -56,6 +96,13 @@ def _create_model_from_schema(agent_schema: dict[str, Any]) -> type[BaseModel]:
         >>> Model = _create_model_from_schema(schema)
         >>> instance = Model(findings=["fact 1", "fact 2"], confidence=0.9)
     """
+    # Identical schemas (same agent-let on every request) reuse the built model
+    key = _schema_digest(agent_schema)
+    cached = _MODEL_CACHE.get(key)
+    if cached is not None:
+        _MODEL_CACHE.move_to_end(key)
+        return cached
+
     # Use json-schema-to-pydantic library for robust conversion
     # Handles nested objects, arrays, required fields, complex types, etc.
     builder = PydanticModelBuilder()
@@ -71,9 +118,29 @@ def _create_model_from_schema(agent_schema: dict[str, Any]) -> type[BaseModel]:
         model.__name__ = agent_schema["title"]
 
     logger.debug(f"Created dynamic Pydantic model from schema: {model.__name__}")
+
+    _MODEL_CACHE[key] = model
+    if len(_MODEL_CACHE) > _MODEL_CACHE_SIZE:
+        _MODEL_CACHE.popitem(last=False)
     return model
 
 
+def _stripped_model_json_schema(cls: type[BaseModel], **kwargs: Any) -> dict[str, Any]:
+    """model_json_schema for schema wrappers: the parent schema without its description.
+
+    Stripped schemas are cached per kwargs (Pydantic AI asks with the same
+    arguments on every run) and copied so callers may mutate the result.
+    """
+    key = frozenset(kwargs.items())
+    schema = cls.__stripped_schemas__.get(key)
+    if schema is None:
+        schema = super(cls, cls).model_json_schema(**kwargs)
+        # Remove model-level description to avoid duplication with system prompt
+        schema.pop("description", None)
+        cls.__stripped_schemas__[key] = schema
+    return copy.deepcopy(schema)
+
+
 def _create_schema_wrapper(result_type: type[BaseModel], strip_description: bool = True) -> type[BaseModel]:
     """Create a wrapper model that customizes schema generation.
 
@@ -89,22 +156,34 @@ def _create_schema_wrapper(result_type: type[BaseModel], strip_description: bool
 
     Returns:
         Wrapper model that generates schema without description field
+        (one wrapper per result_type, reused across calls), or result_type
+        itself when its schema has no description
     """
     if not strip_description:
         return result_type
 
-    # Create a model that overrides schema generation
-    class SchemaWrapper(result_type):  # type: ignore
-        @classmethod
-        def model_json_schema(cls, **kwargs):
-            schema = super().model_json_schema(**kwargs)
-            # Remove model-level description to avoid duplication with system prompt
-            schema.pop("description", None)
-            return schema
+    cached_ref = _SCHEMA_WRAPPERS.get(result_type)
+    cached = cached_ref() if cached_ref is not None else None
+    if cached is not None:
+        return cached
 
-    # Preserve the original model name for debugging
-    SchemaWrapper.__name__ = result_type.__name__
-    return SchemaWrapper
+    # Nothing to strip: use the model as-is (remembered like a wrapper)
+    if "description" not in result_type.model_json_schema():
+        _SCHEMA_WRAPPERS[result_type] = weakref.ref(result_type)
+        return result_type
+
+    # Subclass with the schema override; the original model name is kept for debugging
+    wrapper = type(
+        result_type.__name__,
+        (result_type,),
+        {
+            "__module__": __name__,
+            "__stripped_schemas__": {},
+            "model_json_schema": classmethod(_stripped_model_json_schema),
+        },
+    )
+    _SCHEMA_WRAPPERS[result_type] = weakref.ref(wrapper)
+    return wrapper
 
 
 async def create_agent(
@@ -120,6 +199,9 @@ async def create_agent(
     unless explicitly overridden. MCP tools are dynamically loaded from
     schema metadata and wrapped for Pydantic AI compatibility.
 
+    Agents are cached by schema, model name, result_type and
+    strip_model_description; repeated calls return the same instance.
+
     Args:
         context: AgentContext with schema URI, model, session info
         agent_schema_override: Optional explicit schema (bypasses context.agent_schema_uri)
@@ -137,15 +219,26 @@ async def create_agent(
         >>> agent = await create_agent(ctx, agent_schema_override=schema)
         >>> result = await agent.run("What is percolate?")
     """
-    # Initialize OTEL instrumentation if enabled (idempotent)
-    setup_instrumentation()
-
     # Load agent schema from context or use override
     agent_schema = agent_schema_override
+    schema_future = None
     if agent_schema is None and context and context.agent_schema_uri:
-        # Load from percolate-rocks database or filesystem
+        # Load from percolate-rocks database or filesystem in a worker thread
+        # (blocking I/O), overlapping with instrumentation setup below
         # Database location configured via percolate-rocks settings/env
-        agent_schema = load_agentlet_schema(uri=context.agent_schema_uri, tenant_id=context.tenant_id)
+        schema_future = asyncio.get_running_loop().run_in_executor(
+            None, load_agentlet_schema, context.agent_schema_uri, context.tenant_id
+        )
+
+    # Initialize OTEL instrumentation if enabled, once per process (stays on
+    # the event loop thread so concurrent calls can't race its setup flag)
+    global _instrumentation_ready
+    if not _instrumentation_ready:
+        setup_instrumentation()
+        _instrumentation_ready = True
+
+    if schema_future is not None:
+        agent_schema = await schema_future
 
     # Set agent resource attributes BEFORE creating agent (propagates to all spans)
     set_agent_resource_attributes(agent_schema=agent_schema)
@@ -153,6 +246,20 @@ async def create_agent(
     # Determine model: override > context.default_model > settings
     model = model_override or (context.default_model if context else settings.default_model)
 
+    # Reuse the agent built for an identical configuration. Model instances
+    # aren't reliably comparable, so only model names are cached.
+    cache_key = None
+    if isinstance(model, str):
+        digest = _schema_digest(agent_schema) if agent_schema else None
+        cache_key = (digest, model, result_type, strip_model_description)
+        agent = _AGENT_CACHE.get(cache_key)
+        if agent is not None:
+            _AGENT_CACHE.move_to_end(cache_key)
+            logger.debug("Reusing cached agent for model={}", model)
+            agentlet_name = context.agent_schema_uri if context else None
+            set_agent_context_attributes(context=context, agentlet_name=agentlet_name, agent_schema=agent_schema)
+            return agent
+
     # Extract schema fields
     system_prompt = agent_schema.get("description", "") if agent_schema else ""
     metadata = agent_schema.get("json_schema_extra", {}) if agent_schema else {}
@@ -197,6 +304,10 @@ async def create_agent(
     agentlet_name = context.agent_schema_uri if context else None
     set_agent_context_attributes(context=context, agentlet_name=agentlet_name, agent_schema=agent_schema)
 
+    if cache_key is not None:
+        _AGENT_CACHE[cache_key] = agent
+        if len(_AGENT_CACHE) > _AGENT_CACHE_SIZE:
+            _AGENT_CACHE.popitem(last=False)
     return agent
 
 
@@ -218,47 +329,91 @@ async def _build_mcp_tools(tool_configs: list[dict[str, str]]) -> list:
     """
     logger.debug(f"Building {len(tool_configs)} MCP tools")
 
-    tools = []
-
     # Group tools by MCP server
-    tools_by_server: dict[str, list[dict[str, str]]] = {}
+    tools_by_server: defaultdict[str, list[dict[str, str]]] = defaultdict(list)
     for tool_config in tool_configs:
-        server_name = tool_config["mcp_server"]
-        tools_by_server.setdefault(server_name, []).append(tool_config)
-
-    # Process each server
-    for server_name, tool_config_list in tools_by_server.items():
-        # "percolate" or "default" -> use local tools
-        if server_name in ("percolate", "default"):
-            server_tools = _build_local_tools(tool_config_list)
-            tools.extend(server_tools)
-        else:
-            # TODO: Remote server -> query MCP server for tool schemas
-            # Should work like this:
-            # 1. Look up server URL from env vars (e.g., MCP_SERVER_{NAME}_URL)
-            # 2. Connect to MCP server (HTTP/SSE transport)
-            # 3. Query tools/list endpoint to get available tools
-            # 4. For each tool in tool_config_list, get schema from server
-            # 5. Create Pydantic AI Tool that proxies calls to remote server
-            #
-            # Example:
-            #   server_url = os.getenv(f"MCP_SERVER_{server_name.upper()}_URL")
-            #   async with MCPClient(server_url) as client:
-            #       available_tools = await client.list_tools()
-            #       for tool_config in tool_config_list:
-            #           tool_schema = available_tools[tool_config["tool_name"]]
-            #           tool = create_remote_tool(client, tool_schema)
-            #           server_tools.append(tool)
-            logger.warning(f"Remote MCP server '{server_name}' not yet supported")
+        tools_by_server[tool_config["mcp_server"]].append(tool_config)
+
+    # Build each server's tools concurrently (remote servers will overlap
+    # their tools/list round trips); gather keeps server order
+    server_tools = await asyncio.gather(
+        *(
+            _build_tools_for_server(server_name, tool_config_list)
+            for server_name, tool_config_list in tools_by_server.items()
+        )
+    )
+    return [tool for tools in server_tools for tool in tools]
 
-    return tools
+
+async def _build_tools_for_server(server_name: str, tool_config_list: list[dict[str, str]]) -> list:
+    """Build Tool instances for the tool configs of one MCP server.
+
+    Args:
+        server_name: MCP server name from the tool configs
+        tool_config_list: Tool configurations for that server
+
+    Returns:
+        List of Tool instances (empty for unsupported servers)
+    """
+    # "percolate" or "default" -> use local tools
+    if server_name in ("percolate", "default"):
+        return _build_local_tools(tool_config_list)
+
+    # TODO: Remote server -> query MCP server for tool schemas
+    # Should work like this:
+    # 1. Look up server URL from env vars (e.g., MCP_SERVER_{NAME}_URL)
+    # 2. Connect to MCP server (HTTP/SSE transport)
+    # 3. Query tools/list endpoint to get available tools
+    # 4. For each tool in tool_config_list, get schema from server
+    # 5. Create Pydantic AI Tool that proxies calls to remote server
+    #
+    # Example:
+    #   server_url = os.getenv(f"MCP_SERVER_{server_name.upper()}_URL")
+    #   async with MCPClient(server_url) as client:
+    #       available_tools = await client.list_tools()
+    #       for tool_config in tool_config_list:
+    #           tool_schema = available_tools[tool_config["tool_name"]]
+    #           tool = create_remote_tool(client, tool_schema)
+    #           server_tools.append(tool)
+    logger.warning(f"Remote MCP server '{server_name}' not yet supported")
+    return []
+
+
+# Pydantic AI tools per MCP function; tool functions are module-level
+# singletons, so each schema is generated once per process
+_cached_pydantic_tool = cache(create_pydantic_tool)
+
+# MCP tools importable from percolate.mcplib.tools
+_LOCAL_MCP_TOOLS = frozenset(
+    {"search_knowledge_base", "lookup_entity", "parse_document", "ask_agent", "create_agent"}
+)
+
+
+@cache
+def _load_local_tool(tool_name: str) -> Callable | None:
+    """Import a local MCP tool function on first use.
+
+    Args:
+        tool_name: Tool name from the agent-let tool config
+
+    Returns:
+        The MCP tool function, or None if it is unknown or fails to import
+    """
+    if tool_name not in _LOCAL_MCP_TOOLS:
+        return None
+    try:
+        return getattr(importlib.import_module("percolate.mcplib.tools"), tool_name)
+    except (ImportError, AttributeError):
+        logger.debug(f"{tool_name} tool not available")
+        return None
 
 
 def _build_local_tools(tool_configs: list[dict[str, str]]) -> list:
     """Build Tool instances from local MCP tools.
 
     Uses create_pydantic_tool() to wrap MCP functions with explicit schema
-    and takes_ctx=False.
+    and takes_ctx=False. Wrapped tools are cached per function, and tools
+    listed more than once are built once.
 
     Args:
         tool_configs: List of tool configurations
@@ -281,52 +436,17 @@ def _build_local_tools(tool_configs: list[dict[str, str]]) -> list:
     # - Third-party MCP servers
     #
     # See: https://spec.modelcontextprotocol.io/specification/server/tools/
-    mcp_tools = {}
-
-    # Try to import common MCP tools
-    try:
-        from percolate.mcplib.tools import search_knowledge_base
-        mcp_tools["search_knowledge_base"] = search_knowledge_base
-    except ImportError:
-        logger.debug("search_knowledge_base tool not available")
-
-    try:
-        from percolate.mcplib.tools import lookup_entity
-        mcp_tools["lookup_entity"] = lookup_entity
-    except ImportError:
-        logger.debug("lookup_entity tool not available")
-
-    try:
-        from percolate.mcplib.tools import parse_document
-        mcp_tools["parse_document"] = parse_document
-    except ImportError:
-        logger.debug("parse_document tool not available")
-
-    try:
-        from percolate.mcplib.tools import ask_agent
-        mcp_tools["ask_agent"] = ask_agent
-    except ImportError:
-        logger.debug("ask_agent tool not available")
-
-    try:
-        from percolate.mcplib.tools import create_agent
-        mcp_tools["create_agent"] = create_agent
-    except ImportError:
-        logger.debug("create_agent tool not available")
-
     tools = []
 
-    for tool_config in tool_configs:
-        tool_name = tool_config["tool_name"]
-
-        if tool_name in mcp_tools:
-            mcp_tool_func = mcp_tools[tool_name]
-
+    # Each tool once, in first-listed order (schemas may list a tool twice)
+    for tool_name in dict.fromkeys(tool_config["tool_name"] for tool_config in tool_configs):
+        mcp_tool_func = _load_local_tool(tool_name)
+        if mcp_tool_func is not None:
             # Create Pydantic AI Tool instance with explicit schema
-            tool = create_pydantic_tool(mcp_tool_func)
+            tool = _cached_pydantic_tool(mcp_tool_func)
             tools.append(tool)
             logger.info(f"Built local tool: {tool_name}")
         else:
-            logger.warning(f"Local tool '{tool_name}' not found in mcp_tools map")
+            logger.warning(f"Local tool '{tool_name}' not found in local MCP tools")
 
     return tools
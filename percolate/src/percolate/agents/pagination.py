@@ -11,36 +11,104 @@ Usage:
         content=large_document,
         config=PaginationConfig(merge_strategy="merge", chunk_size=50)
     )
+
+Repeated documents or overlapping inputs can skip the LLM by passing a cache
+(any CacheBackend, e.g. LLMCache) in PaginationConfig.cache.
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
-from typing import Any, Callable, Literal
+import hashlib
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
+from typing import Any, Literal, Protocol, runtime_checkable
 
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic_ai import Agent
 
-from percolate.utils.chunking import (
-    chunk_by_records,
-    chunk_by_tokens,
-    is_list_content,
-)
+from percolate.agents.tool_wrapper import dedupe_tool_calls
+from percolate.utils.chunking import chunk_by_records, chunk_by_tokens
+from percolate.utils.serialization import json_dumps_canonical, json_loads
 
 MergeStrategy = Literal["concat", "merge", "first", "last", "custom"]
 
+# Output schema digests per output model (weak keys: dynamic agent-let models
+# are evicted from the factory's cache and must not be kept alive here)
+_OUTPUT_SCHEMA_DIGESTS: weakref.WeakKeyDictionary[type[BaseModel], str] = weakref.WeakKeyDictionary()
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Async key-value store for chunk outputs (in-memory, Redis, ...)."""
+
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def clear(self) -> None: ...
+
+
+class LLMCache:
+    """In-process LRU cache of chunk outputs, keyed by prompt digest.
+
+    Entries expire after their ttl (seconds). hits/misses count lookups so
+    callers can log the hit rate.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
 
 class PaginationConfig(BaseModel):
     """Configuration for pagination."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     chunk_size: int | None = None
+    overlap_tokens: int = Field(default=0, ge=0)  # Text only: tokens repeated from the previous chunk
     merge_strategy: MergeStrategy = "last"
     custom_merge_fn: Callable[[list[Any]], Any] | None = None
     parallel: bool = True
+    max_concurrent: int = Field(default=8, ge=1)  # Cap on in-flight chunk calls when parallel
     include_chunk_metadata: bool = True
     model_name: str = "claude-sonnet-4-5"
+    cache: CacheBackend | None = None  # Reuse outputs for identical chunk prompts (temperature 0 agents)
+    cache_ttl: int | None = 3600  # Seconds; None keeps entries until evicted
 
 
 async def paginated_request(
@@ -73,44 +141,134 @@ async def paginated_request(
     if config.merge_strategy == "custom" and not config.custom_merge_fn:
         raise ValueError("custom merge strategy requires custom_merge_fn")
 
-    # Chunk content
-    if is_list_content(content):
-        logger.info("Using record-based chunking")
-        if isinstance(content, str):
-            content = json.loads(content)
-        chunks = chunk_by_records(content, config.model_name, max_records_per_chunk=config.chunk_size)  # type: ignore
-    else:
-        logger.info("Using token-based chunking")
-        if isinstance(content, list):
-            content = json.dumps(content, indent=2)
-        chunks = chunk_by_tokens(content, config.model_name, max_chunk_tokens=config.chunk_size)  # type: ignore
-
-    logger.info(f"Split into {len(chunks)} chunks")
+    chunks = _chunk_content(content, config)
 
     # Single chunk - no pagination needed
     if len(chunks) == 1:
         logger.info("Single chunk, executing directly")
-        result = await agent.run(chunks[0])
-        return result.output
+        return await _execute_chunk(agent, chunks[0], 0, 1, False, config.cache, config.cache_ttl)
+
+    # Chunks run independently: "first" only needs (and pays for) the first one
+    if config.merge_strategy == "first":
+        logger.info(f"Executing chunk 1/{len(chunks)} only (strategy=first)")
+        return await _execute_chunk(
+            agent, chunks[0], 0, len(chunks), config.include_chunk_metadata, config.cache, config.cache_ttl
+        )
 
-    # Execute chunks
     if config.parallel:
-        logger.info(f"Executing {len(chunks)} chunks in parallel")
-        tasks = [
-            _execute_chunk(agent, chunk, i, len(chunks), config.include_chunk_metadata)
-            for i, chunk in enumerate(chunks)
-        ]
-        results = await asyncio.gather(*tasks)
+        logger.info(
+            f"Executing {len(chunks)} chunks in parallel (max_concurrent={config.max_concurrent})"
+        )
     else:
         logger.info(f"Executing {len(chunks)} chunks sequentially")
-        results = []
+
+    # Merge outputs as chunks complete instead of holding them all
+    logger.info(f"Merging {len(chunks)} results with strategy={config.merge_strategy}")
+    async with aclosing(_stream_chunks(agent, chunks, config)) as outputs:
+        return await _fold_outputs(outputs, len(chunks), config)
+
+
+async def paginated_request_stream(
+    agent: Agent,
+    content: str | list,
+    config: PaginationConfig,
+) -> AsyncIterator[tuple[int, Any]]:
+    """Execute agent with automatic pagination, yielding results as chunks complete.
+
+    Streaming counterpart of paginated_request: instead of merging, yields
+    (chunk_index, output) pairs in completion order (chunk order when
+    config.parallel is False), so callers can process early results while
+    slower chunks are still running. Merge strategy settings are ignored.
+
+    Args:
+        agent: Pre-configured agent with model and schema
+        content: Large input (string or list of records)
+        config: Pagination configuration
+
+    Yields:
+        (chunk_index, output) for each chunk
+
+    Example:
+        >>> async for index, output in paginated_request_stream(agent, large_doc, config):
+        ...     print(index, output.entities)
+    """
+    async with aclosing(_stream_chunks(agent, _chunk_content(content, config), config)) as outputs:
+        async for item in outputs:
+            yield item
+
+
+async def _stream_chunks(
+    agent: Agent,
+    chunks: list[str],
+    config: PaginationConfig,
+) -> AsyncIterator[tuple[int, Any]]:
+    """Run the agent on each chunk, yielding (chunk_index, output) as chunks complete.
+
+    Parallel runs keep at most config.max_concurrent calls in flight (unbounded
+    fan-out against an LLM endpoint triggers rate limiting). Closing the
+    generator early, or a chunk failing, cancels the chunks still running.
+    """
+    total = len(chunks)
+    include_metadata = config.include_chunk_metadata and total > 1
+
+    if not config.parallel:
         for i, chunk in enumerate(chunks):
-            result = await _execute_chunk(agent, chunk, i, len(chunks), config.include_chunk_metadata)
-            results.append(result)
+            yield i, await _execute_chunk(
+                agent, chunk, i, total, include_metadata, config.cache, config.cache_ttl
+            )
+        return
+
+    semaphore = asyncio.Semaphore(config.max_concurrent)
+
+    async def run(chunk: str, chunk_index: int) -> tuple[int, Any]:
+        async with semaphore:
+            return chunk_index, await _execute_chunk(
+                agent, chunk, chunk_index, total, include_metadata, config.cache, config.cache_ttl
+            )
+
+    # Tasks copy the context at creation, so chunks share identical tool calls
+    with dedupe_tool_calls():
+        tasks = [asyncio.create_task(run(chunk, i)) for i, chunk in enumerate(chunks)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Consumer stopped early or a chunk failed: don't leave chunks running,
+        # and wait for them so none outlives this call or leaves an
+        # unretrieved exception behind
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _chunk_content(content: str | list, config: PaginationConfig) -> list[str]:
+    """Split content into chunks (record-based for lists, token-based for text)."""
+    records = content if isinstance(content, list) else _parse_records(content)
+    if records is not None:
+        logger.info("Using record-based chunking")
+        chunks = chunk_by_records(records, config.model_name, max_records_per_chunk=config.chunk_size)
+    else:
+        logger.info("Using token-based chunking")
+        chunks = chunk_by_tokens(
+            content,  # type: ignore
+            config.model_name,
+            max_chunk_tokens=config.chunk_size,
+            overlap_tokens=config.overlap_tokens,
+        )
+
+    logger.info(f"Split into {len(chunks)} chunks")
+    return chunks
+
 
-    # Merge results
-    logger.info(f"Merging {len(results)} results with strategy={config.merge_strategy}")
-    return _merge_results(results, config.merge_strategy, config.custom_merge_fn)
+def _parse_records(content: str) -> list | None:
+    """Parse text that is a JSON array (parsed once, not checked then re-parsed), else None."""
+    if not content.lstrip().startswith("["):
+        return None
+    try:
+        parsed = json_loads(content)
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, list) else None
 
 
 async def _execute_chunk(
@@ -119,19 +277,128 @@ async def _execute_chunk(
     chunk_index: int,
     total_chunks: int,
     include_metadata: bool,
+    cache: CacheBackend | None = None,
+    cache_ttl: int | None = None,
 ) -> Any:
-    """Execute agent on single chunk."""
+    """Execute agent on single chunk, serving repeated prompts from cache."""
+    chunk_input: str | list[str]
     if include_metadata:
-        chunk_input = f"[Processing part {chunk_index + 1}/{total_chunks}]\n\n{chunk}"
+        # Separate content parts: the (large) chunk is sent as-is, not copied
+        # into a new string behind the part marker
+        chunk_input = [f"[Processing part {chunk_index + 1}/{total_chunks}]", chunk]
     else:
         chunk_input = chunk
 
-    logger.debug(f"Executing chunk {chunk_index + 1}/{total_chunks}")
+    cache_key = None
+    if cache is not None and not _is_stochastic(agent):
+        cache_key = _chunk_cache_key(agent, chunk_input)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Cache hit for chunk {}/{}", chunk_index + 1, total_chunks)
+            return cached
+
+    logger.debug("Executing chunk {}/{}", chunk_index + 1, total_chunks)
     result = await agent.run(chunk_input)
-    logger.debug(f"Completed chunk {chunk_index + 1}/{total_chunks}")
+    logger.debug("Completed chunk {}/{}", chunk_index + 1, total_chunks)
+
+    if cache_key is not None:
+        await cache.set(cache_key, result.output, ttl=cache_ttl)
     return result.output
 
 
+def _chunk_cache_key(agent: Agent, chunk_input: str | list[str]) -> str:
+    """Digest of everything that determines a chunk's output: model, prompts, tools, output type, input."""
+    model = getattr(agent, "model", None)
+    output_type = getattr(agent, "output_type", None)
+    function_toolset = getattr(agent, "_function_toolset", None)
+    payload = {
+        "model": getattr(model, "model_name", model),
+        "system": getattr(agent, "_system_prompts", ()),
+        "system_functions": [
+            _callable_key(runner.function) for runner in getattr(agent, "_system_prompt_functions", ())
+        ],
+        "tools": {
+            name: _callable_key(tool.function)
+            for name, tool in getattr(function_toolset, "tools", {}).items()
+        },
+        "output": _output_type_key(output_type),
+        "input": chunk_input,
+    }
+    return hashlib.sha256(json_dumps_canonical(payload)).hexdigest()
+
+
+def _callable_key(func: Callable[..., Any]) -> str:
+    """Identify a system prompt or tool function for cache keys."""
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def _output_type_key(output_type: Any) -> Any:
+    """Identify an output type for cache keys.
+
+    Models are identified by a digest of their JSON schema, not their name:
+    dynamic models built from different agent schemas can share a title.
+    """
+    if not (isinstance(output_type, type) and issubclass(output_type, BaseModel)):
+        return getattr(output_type, "__qualname__", output_type)
+    digest = _OUTPUT_SCHEMA_DIGESTS.get(output_type)
+    if digest is None:
+        schema = json_dumps_canonical(output_type.model_json_schema())
+        digest = _OUTPUT_SCHEMA_DIGESTS[output_type] = hashlib.blake2b(schema, digest_size=16).hexdigest()
+    return digest
+
+
+def _is_stochastic(agent: Agent) -> bool:
+    """Whether the agent's outputs are not reusable.
+
+    Only agents with an explicit temperature of 0 are deterministic; without
+    one the provider samples with its own default temperature.
+    """
+    model_settings = getattr(agent, "model_settings", None)
+    if not isinstance(model_settings, dict):
+        return True
+    temperature = model_settings.get("temperature")
+    return not (isinstance(temperature, (int, float)) and temperature == 0)
+
+
+async def _fold_outputs(
+    outputs: AsyncIterator[tuple[int, Any]],
+    total: int,
+    config: PaginationConfig,
+) -> Any:
+    """Merge streamed chunk outputs according to config.merge_strategy.
+
+    Results are the same as _merge_results over outputs in chunk order, but
+    outputs are dropped as soon as they are no longer needed: "merge" folds
+    each one into the accumulator (buffering only those that arrive ahead of
+    an earlier chunk) and "last" keeps only the final chunk.
+    """
+    strategy = config.merge_strategy
+
+    if strategy == "last":
+        last = None
+        async for index, output in outputs:
+            if index == total - 1:
+                last = output
+        return last
+
+    if strategy == "merge":
+        merger = _ResultMerger()
+        pending: dict[int, Any] = {}
+        next_index = 0
+        async for index, output in outputs:
+            pending[index] = output
+            while next_index in pending:
+                merger.add(pending.pop(next_index))
+                next_index += 1
+        return merger.result()
+
+    # Other strategies need every output
+    ordered: list[Any] = [None] * total
+    async for index, output in outputs:
+        ordered[index] = output
+    return _merge_results(ordered, strategy, config.custom_merge_fn)
+
+
 def _merge_results(
     results: list[Any],
     strategy: MergeStrategy,
@@ -141,20 +408,26 @@ def _merge_results(
     if not results:
         return None
 
-    if strategy == "first":
-        return results[0]
-    if strategy == "last":
-        return results[-1]
-    if strategy == "concat":
-        return results
-    if strategy == "merge":
-        return _merge_recursive(results)
-    if strategy == "custom":
-        if not custom_fn:
-            raise ValueError("custom strategy requires custom_merge_fn")
-        return custom_fn(results)
+    merge = _STRATEGIES.get(strategy)
+    if merge is None:
+        raise ValueError(f"Unknown merge strategy: {strategy}")
+    return merge(results, custom_fn)
 
-    raise ValueError(f"Unknown merge strategy: {strategy}")
+
+def _merge_custom(results: list[Any], custom_fn: Callable[[list[Any]], Any] | None) -> Any:
+    if not custom_fn:
+        raise ValueError("custom strategy requires custom_merge_fn")
+    return custom_fn(results)
+
+
+# Merge strategy -> merge(results, custom_fn)
+_STRATEGIES: dict[str, Callable[[list[Any], Callable[[list[Any]], Any] | None], Any]] = {
+    "first": lambda results, _: results[0],
+    "last": lambda results, _: results[-1],
+    "concat": lambda results, _: results,
+    "merge": lambda results, _: _merge_recursive(results),
+    "custom": _merge_custom,
+}
 
 
 def _merge_recursive(results: list[Any]) -> Any:
@@ -163,56 +436,122 @@ def _merge_recursive(results: list[Any]) -> Any:
     Rules:
     - List fields: Extend all items
     - Dict fields: Recursive merge
+    - Nested models of the same type: Recursive merge
     - Primitives: Keep first value
     """
-    if not results:
-        return None
-
-    first = results[0]
-    is_pydantic = isinstance(first, BaseModel)
-
-    if is_pydantic:
-        dict_results = [r.model_dump() if isinstance(r, BaseModel) else r for r in results]
-        merged_dict = _merge_dicts(dict_results)
-        return type(first)(**merged_dict)
-
-    if isinstance(first, dict):
-        return _merge_dicts(results)
-
-    return first
-
-
-def _merge_dicts(dicts: list[dict]) -> dict:
-    """Merge list of dicts."""
-    if not dicts:
-        return {}
-
-    merged = {}
-    all_keys = set()
-    for d in dicts:
-        all_keys.update(d.keys())
-
-    for key in all_keys:
-        values = [d.get(key) for d in dicts if key in d]
-        if not values:
+    merger = _ResultMerger()
+    for result in results:
+        merger.add(result)
+    return merger.result()
+
+
+class _ResultMerger:
+    """Incremental _merge_recursive: add results one at a time, then build the merge."""
+
+    def __init__(self) -> None:
+        self._first: Any = None
+        self._count = 0
+        self._fields: dict = {}
+        self._fields_set: set[str] = set()
+        self._same_type = True
+
+    def add(self, result: Any) -> None:
+        if self._count == 0:
+            self._first = result
+        self._count += 1
+
+        first = self._first
+        if isinstance(first, BaseModel):
+            if type(result) is type(first):
+                # Field values come from validated models: merge them directly
+                # and skip the model_dump/re-validation round trip
+                _merge_into(self._fields, _model_fields(result))
+                self._fields_set |= result.model_fields_set
+            else:
+                self._same_type = False
+                _merge_into(self._fields, result.model_dump() if isinstance(result, BaseModel) else result)
+        elif isinstance(first, dict):
+            _merge_into(self._fields, result)
+
+    def accepts(self, value: Any) -> bool:
+        """Whether value is a model of the same type as the first result."""
+        return type(value) is type(self._first)
+
+    def result(self) -> Any:
+        if not self._count:
+            return None
+
+        _build_merged(self._fields)
+        first = self._first
+        if isinstance(first, BaseModel):
+            if self._same_type:
+                return type(first).model_construct(_fields_set=self._fields_set, **self._fields)
+            return type(first)(**self._fields)
+        if isinstance(first, dict):
+            return self._fields
+        return first
+
+
+def _model_fields(model: BaseModel) -> dict[str, Any]:
+    """Field (and extra) values of a model, without dumping nested models."""
+    if model.__pydantic_extra__:
+        return {**model.__dict__, **model.__pydantic_extra__}
+    return model.__dict__
+
+
+def _merge_into(merged: dict, d: dict) -> dict:
+    """Merge d into the accumulator merged (owned by the caller) in place.
+
+    Single pass over d's entries: each value is merged according to the kind
+    (list, dict, model, primitive) of the key's first value. Keys keep
+    first-seen order; input dicts and lists are not modified. Nested models
+    merged more than once are held as _ResultMerger until _build_merged, so
+    each value is merged once instead of re-merging the growing model on
+    every chunk.
+    """
+    for key, value in d.items():
+        if key not in merged:
+            # First value: copy containers so later merges don't touch inputs
+            if isinstance(value, list):
+                merged[key] = list(value)
+            elif isinstance(value, dict):
+                merged[key] = _merge_into({}, value)
+            else:
+                merged[key] = value
             continue
 
-        first_value = values[0]
+        current = merged[key]
 
         # List fields: extend
-        if isinstance(first_value, list):
-            merged_list = []
-            for v in values:
-                if isinstance(v, list):
-                    merged_list.extend(v)
-            merged[key] = merged_list
+        if isinstance(current, list):
+            if isinstance(value, list):
+                current.extend(value)
 
         # Dict fields: recursive merge
-        elif isinstance(first_value, dict):
-            merged[key] = _merge_dicts([v for v in values if isinstance(v, dict)])
+        elif isinstance(current, dict):
+            if isinstance(value, dict):
+                _merge_into(current, value)
+
+        # Nested models of the same type: merge field by field
+        elif isinstance(current, _ResultMerger):
+            if current.accepts(value):
+                current.add(value)
+        elif isinstance(current, BaseModel):
+            if type(value) is type(current):
+                nested = merged[key] = _ResultMerger()
+                nested.add(current)
+                nested.add(value)
 
         # Primitives: keep first
-        else:
-            merged[key] = first_value
 
     return merged
+
+
+def _build_merged(merged: dict) -> dict:
+    """Replace pending nested model merges in an accumulator with their result."""
+    for key, value in merged.items():
+        if isinstance(value, _ResultMerger):
+            merged[key] = value.result()
+        elif isinstance(value, dict):
+            _build_merged(value)
+    return merged
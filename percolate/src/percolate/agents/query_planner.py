@@ -4,6 +4,9 @@ This agent uses LLM to detect intent and generate parameters for QueryBuilder.
 Optimized for low token usage with concise prompts and outputs.
 """
 
+import hashlib
+import re
+from collections import OrderedDict
 from typing import Any
 
 from pydantic_ai import Agent, RunContext
@@ -65,9 +68,68 @@ STAGING:
 Be CONCISE. Only explain when confidence <0.75."""
 
 
+# Planner agents by model name; agents hold no per-run state
+_PLANNER_CACHE: dict[str, Agent[None, QueryPlan]] = {}
+
+# Plans for repeated queries (LRU), keyed by _plan_cache_key
+_PLAN_CACHE: OrderedDict[str, QueryPlan] = OrderedDict()
+_PLAN_CACHE_SIZE = 1024
+
+# Only confident plans are reused; ambiguous ones are re-planned
+_PLAN_CACHE_MIN_CONFIDENCE = 0.75
+
+
+def _plan_cache_key(
+    model_name: str,
+    user_query: str,
+    available_schemas: list[str] | None,
+    schema_hint: str | None,
+) -> str:
+    """Digest of the planner inputs, ignoring query whitespace and schema order.
+
+    Case is kept: it can change the plan (names, identifiers, exact-match filters).
+    """
+    normalized_query = " ".join(user_query.split())
+    schemas = ",".join(sorted(available_schemas or []))
+    raw = "|".join((model_name, normalized_query, schema_hint or "", schemas))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+# Queries made up only of UUIDs (comma/space/"and" separated) have one plan:
+# an exact LOOKUP, which the planner prompt rates at confidence 1.0
+_UUID_PATTERN = r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+_UUID_ONLY_QUERY = re.compile(rf"\s*{_UUID_PATTERN}(?:\s*(?:,|\band\b|\s)\s*{_UUID_PATTERN})*\s*", re.IGNORECASE)
+_UUID = re.compile(_UUID_PATTERN)
+
+
+def _plan_from_template(user_query: str) -> QueryPlan | None:
+    """Build the plan for queries whose structure fixes it, without the LLM.
+
+    Returns:
+        LOOKUP plan for UUID-only queries, None for anything else
+    """
+    if not _UUID_ONLY_QUERY.fullmatch(user_query):
+        return None
+
+    keys = list(dict.fromkeys(_UUID.findall(user_query)))
+    return QueryPlan(
+        query_type=QueryType.LOOKUP,
+        confidence=1.0,
+        primary_query=Query(
+            dialect=QueryDialect.REM_SQL,
+            query_string="LOOKUP " + ", ".join(f"'{key}'" for key in keys),
+            parameters={"keys": keys},
+        ),
+        execution_mode=ExecutionMode.SINGLE_PASS,
+        reasoning="Exact UUID lookup",
+    )
+
+
 def create_query_planner(model: str | None = None) -> Agent[None, QueryPlan]:
     """Create query planner agent.
 
+    Agents are built once per model name and reused by later calls.
+
     Args:
         model: LLM model to use (default: settings.get_query_model())
 
@@ -81,12 +143,15 @@ def create_query_planner(model: str | None = None) -> Agent[None, QueryPlan]:
     """
     model_name = model or settings.get_query_model()
 
-    # Agent is generic in output type
-    return Agent(
-        model_name,
-        output_type=QueryPlan,  # Changed from result_type
-        system_prompt=QUERY_PLANNER_SYSTEM_PROMPT,
-    )
+    planner = _PLANNER_CACHE.get(model_name)
+    if planner is None:
+        # Agent is generic in output type
+        planner = _PLANNER_CACHE[model_name] = Agent(
+            model_name,
+            output_type=QueryPlan,  # Changed from result_type
+            system_prompt=QUERY_PLANNER_SYSTEM_PROMPT,
+        )
+    return planner
 
 
 async def plan_query(
@@ -106,6 +171,10 @@ async def plan_query(
     Returns:
         QueryPlan with parameters for QueryBuilder
 
+    UUID-only queries are planned as LOOKUPs without calling the LLM. Other
+    plans with confidence >= 0.75 are cached per model, normalized query,
+    schema hint and schema set, so repeated queries skip the LLM call.
+
     Example:
         >>> # Without schema
         >>> plan = await plan_query("indoor plants resources")
@@ -114,7 +183,20 @@ async def plan_query(
         >>> # With available schemas
         >>> plan = await plan_query("find articles", available_schemas=["articles", "resources"])
     """
-    planner = create_query_planner(model)
+    # Structurally fixed queries (UUID lookups) don't need the LLM
+    template_plan = _plan_from_template(user_query)
+    if template_plan is not None:
+        return template_plan
+
+    model_name = model or settings.get_query_model()
+    cache_key = _plan_cache_key(model_name, user_query, available_schemas, schema_hint)
+    cached = _PLAN_CACHE.get(cache_key)
+    if cached is not None:
+        _PLAN_CACHE.move_to_end(cache_key)
+        # Copy so callers can't alter the cached plan
+        return cached.model_copy(deep=True)
+
+    planner = create_query_planner(model_name)
 
     # Build context message
     context_parts = [f"User query: {user_query}"]
@@ -132,5 +214,11 @@ async def plan_query(
 
     # Run agent
     result = await planner.run(context_message)
+    plan = result.output
+
+    if plan.confidence >= _PLAN_CACHE_MIN_CONFIDENCE:
+        _PLAN_CACHE[cache_key] = plan.model_copy(deep=True)
+        if len(_PLAN_CACHE) > _PLAN_CACHE_SIZE:
+            _PLAN_CACHE.popitem(last=False)
 
-    return result.output
+    return plan
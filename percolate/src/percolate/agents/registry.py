@@ -5,13 +5,18 @@ for similarity search. System agents are loaded from filesystem, user agents
 from database with tenant isolation.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
-import json
+
+from percolate.utils.serialization import json_loads
 
 # TODO: Import percolate-rocks package once available
 # from percolate_rocks import Database
 
+# (agentlets directory mtime_ns, agent metadata) from the last scan
+_SYSTEM_AGENTLETS_CACHE: tuple[int, list[dict[str, Any]]] | None = None
+
 
 def load_agentlet_schema(uri: str, tenant_id: str = "default") -> dict[str, Any]:
     """Load agent-let schema by URI from percolate-rocks or filesystem.
@@ -61,6 +66,9 @@ def list_system_agentlets() -> list[dict[str, Any]]:
     Scans the schema/agentlets directory and returns metadata for all
     system agents. Used for agent discovery via MCP resources or CLI.
 
+    The scan is cached until the directory's mtime changes (a schema file
+    is added, removed or renamed).
+
     Returns:
         List of agent metadata dicts (short_name, version, description)
 
@@ -69,20 +77,26 @@ def list_system_agentlets() -> list[dict[str, Any]]:
         >>> [a["short_name"] for a in agents]
         ['researcher', 'classifier', 'summarizer']
     """
+    global _SYSTEM_AGENTLETS_CACHE
+
     agentlets_dir = _get_agentlets_dir()
+    dir_mtime = agentlets_dir.stat().st_mtime_ns
+    if _SYSTEM_AGENTLETS_CACHE is not None and _SYSTEM_AGENTLETS_CACHE[0] == dir_mtime:
+        return [dict(agent) for agent in _SYSTEM_AGENTLETS_CACHE[1]]
+
     agents = []
 
     for schema_file in agentlets_dir.glob("*.json"):
-        with open(schema_file) as f:
-            schema = json.load(f)
-            agents.append({
-                "short_name": schema.get("short_name", schema_file.stem),
-                "version": schema.get("version", "1.0.0"),
-                "description": schema.get("description", ""),
-                "uri": schema_file.stem,
-            })
+        schema = json_loads(schema_file.read_bytes())
+        agents.append({
+            "short_name": schema.get("short_name", schema_file.stem),
+            "version": schema.get("version", "1.0.0"),
+            "description": schema.get("description", ""),
+            "uri": schema_file.stem,
+        })
 
-    return agents
+    _SYSTEM_AGENTLETS_CACHE = (dir_mtime, agents)
+    return [dict(agent) for agent in agents]
 
 
 def list_user_agentlets(tenant_id: str) -> list[dict[str, Any]]:
@@ -186,7 +200,8 @@ def _load_system_agentlet(uri: str) -> dict[str, Any]:
     System agent-lets are shipped with percolate in schema/agentlets/.
     These are available to all tenants and serve as templates.
 
-    Future optimization: Cache in percolate-rocks for faster lookups.
+    The file text is cached per URI (see _read_system_agentlet); each call
+    parses it into a fresh dict, so callers may mutate the result.
 
     Args:
         uri: System agent URI (e.g., 'researcher', 'system/classifier')
@@ -201,15 +216,18 @@ def _load_system_agentlet(uri: str) -> dict[str, Any]:
     if uri.startswith("system/"):
         uri = uri[7:]
 
-    # Construct path to schema file
-    schema_path = _get_system_agentlet_path(uri)
+    return json_loads(_read_system_agentlet(uri))
 
-    if not schema_path.exists():
-        raise FileNotFoundError(f"System agent-let not found: {uri} (path: {schema_path})")
 
-    # Load and return schema
-    with open(schema_path) as f:
-        return json.load(f)
+@lru_cache(maxsize=128)
+def _read_system_agentlet(uri: str) -> str:
+    """Read system agent-let schema text (cached; misses raise and are not cached)."""
+    schema_path = _get_system_agentlet_path(uri)
+
+    try:
+        return schema_path.read_text()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"System agent-let not found: {uri} (path: {schema_path})") from None
 
 
 def _get_agentlets_dir() -> Path:
@@ -8,12 +8,44 @@ Key insight: The docstring of the MCP tool IS the system prompt - avoid duplicat
 by stripping model-level descriptions when they match the system prompt.
 """
 
+import asyncio
 import inspect
 import json
-from typing import Any, Callable, get_type_hints
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache
+from typing import Any, get_type_hints
 
+from pydantic import TypeAdapter
 from pydantic_ai.tools import Tool
 
+# In-flight tool calls keyed by (tool name, canonical JSON args). Set per
+# request by dedupe_tool_calls(); None means calls are never shared.
+_inflight_tool_calls: ContextVar[dict[tuple[str, str], asyncio.Future] | None] = ContextVar(
+    "_inflight_tool_calls", default=None
+)
+
+
+@contextmanager
+def dedupe_tool_calls() -> Iterator[None]:
+    """Share identical concurrent tool calls made within this block.
+
+    Tasks created inside the block (e.g. parallel chunks of one paginated
+    request) see the same in-flight map, so N chunks calling
+    search_knowledge_base("x") at once make one backend call. Separate
+    blocks get separate maps; a call is shared only while it is running.
+
+    Example:
+        with dedupe_tool_calls():
+            tasks = [tg.create_task(agent.run(chunk)) for chunk in chunks]
+    """
+    token = _inflight_tool_calls.set({})
+    try:
+        yield
+    finally:
+        _inflight_tool_calls.reset(token)
+
 
 def create_pydantic_tool(mcp_tool_func: Callable) -> Tool:
     """Create a Pydantic AI Tool instance from an MCP tool function.
@@ -50,6 +82,7 @@ def create_pydantic_tool(mcp_tool_func: Callable) -> Tool:
     # Build JSON schema for parameters (excluding 'ctx')
     properties = {}
     required = []
+    defs: dict[str, Any] = {}
     has_ctx = False
 
     for name, param in sig.parameters.items():
@@ -60,8 +93,9 @@ def create_pydantic_tool(mcp_tool_func: Callable) -> Tool:
         # Get type annotation
         param_type = type_hints.get(name, Any)
 
-        # Build JSON schema property
-        prop_schema: dict[str, Any] = {"type": _python_type_to_json_type(param_type)}
+        # Build JSON schema property, hoisting nested model definitions
+        prop_schema = _param_json_schema(param_type)
+        defs.update(prop_schema.pop("$defs", {}))
 
         # Use parameter name as description
         prop_schema["description"] = f"{name} parameter"
@@ -78,16 +112,32 @@ def create_pydantic_tool(mcp_tool_func: Callable) -> Tool:
         "properties": properties,
         "required": required,
     }
+    if defs:
+        json_schema["$defs"] = defs
 
     # Create wrapper function that calls MCP tool
     # Only pass ctx=None if the original function has a ctx parameter
-    async def wrapper(**kwargs: Any) -> Any:
-        """Wrapper that calls MCP tool."""
+    async def call(**kwargs: Any) -> Any:
         if has_ctx:
             return await mcp_tool_func(ctx=None, **kwargs)
         else:
             return await mcp_tool_func(**kwargs)
 
+    async def wrapper(**kwargs: Any) -> Any:
+        """Wrapper that calls MCP tool, joining an identical in-flight call if any."""
+        inflight = _inflight_tool_calls.get()
+        if inflight is None:
+            return await call(**kwargs)
+
+        key = (func_name, json.dumps(kwargs, sort_keys=True, default=str))
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call(**kwargs))
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        # Shield so one cancelled caller doesn't cancel the call for the others
+        return await asyncio.shield(task)
+
     # Create Tool using from_schema
     return Tool.from_schema(
         function=wrapper,
@@ -98,28 +148,27 @@ def create_pydantic_tool(mcp_tool_func: Callable) -> Tool:
     )
 
 
-def _python_type_to_json_type(python_type: Any) -> str:
-    """Convert Python type hint to JSON schema type.
+@cache
+def _type_adapter(python_type: Any) -> TypeAdapter:
+    """Get the (memoized) TypeAdapter for a parameter type."""
+    return TypeAdapter(python_type)
+
+
+def _param_json_schema(python_type: Any) -> dict[str, Any]:
+    """Build the JSON schema for a tool parameter type.
 
-    Simplified converter for basic types. For production, consider using
-    Pydantic's TypeAdapter for more robust type conversion.
+    Handles Optional, Union, list, dict and Pydantic models. Nested model
+    references point at the tool schema's top-level $defs.
 
     Args:
         python_type: Python type hint
 
     Returns:
-        JSON schema type string
+        JSON schema dict (a fresh copy, safe to mutate)
     """
-    # Handle basic types
-    if python_type == str or python_type == "str":
-        return "string"
-    elif python_type == int or python_type == "int":
-        return "integer"
-    elif python_type == float or python_type == "float":
-        return "number"
-    elif python_type == bool or python_type == "bool":
-        return "boolean"
-
-    # For complex types, default to string
-    # TODO: Handle Union, Optional, List, Dict properly
-    return "string"
+    try:
+        adapter = _type_adapter(python_type)
+    except TypeError:
+        # Unhashable annotation
+        adapter = TypeAdapter(python_type)
+    return adapter.json_schema(ref_template="#/$defs/{model}")
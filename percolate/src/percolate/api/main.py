@@ -38,19 +38,15 @@ Endpoints
 - /docs                     : OpenAPI documentation
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response
 from loguru import logger
 
-from percolate.api.routers.chat import router as chat_router
-from percolate.api.routers.device import router as device_router
-from percolate.api.routers.health import router as health_router
-from percolate.api.routers.oauth import router as oauth_router
-from percolate.api.routers.oauth_dev import router as oauth_dev_router
-from percolate.api.routers.test_topology import router as test_topology_router
-from percolate.mcplib.server import create_mcp_server
 from percolate.settings import settings
+from percolate.utils.serialization import json_dumps_canonical
 from percolate.version import __version__
 
 
@@ -58,12 +54,33 @@ from percolate.version import __version__
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     logger.info("Starting Percolate API")
+
+    # Eager tasks (Python 3.12+) run inside create_task until they first
+    # suspend, so fan-out work that completes synchronously (e.g. paginated
+    # chunks served from cache) finishes without an event-loop round trip
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     yield
     logger.info("Shutting down Percolate API")
 
+    # Save session messages still queued by chat completions
+    from percolate.api.routers.chat.dependencies import close_session_writer
+
+    await close_session_writer()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
+    # Imported here so loading this module doesn't pull in FastMCP and
+    # Pydantic AI until an app is actually built
+    from percolate.api.routers.chat import router as chat_router
+    from percolate.api.routers.device import router as device_router
+    from percolate.api.routers.health import router as health_router
+    from percolate.api.routers.oauth import router as oauth_router
+    from percolate.api.routers.oauth_dev import router as oauth_dev_router
+    from percolate.api.routers.test_topology import router as test_topology_router
+    from percolate.mcplib.server import create_mcp_server
 
     # Create MCP server and get HTTP app
     mcp_server = create_mcp_server()
@@ -83,11 +100,10 @@ def create_app() -> FastAPI:
         lifespan=combined_lifespan,
     )
 
-    # Define root endpoint BEFORE mounting MCP app
-    @app.get("/")
-    async def root():
-        """Root endpoint with API information."""
-        return {
+    # Root and version payloads are fixed per process, so their JSON is
+    # encoded once here rather than on every (health-checker) request
+    root_body = json_dumps_canonical(
+        {
             "name": "Percolate API",
             "version": __version__,
             "mcp_endpoint": "/mcp",
@@ -95,16 +111,26 @@ def create_app() -> FastAPI:
             "auth_enabled": settings.auth.enabled,
             "auth_provider": settings.auth.provider if settings.auth.enabled else "disabled",
         }
-
-    @app.get("/version")
-    async def version():
-        """Version information endpoint."""
-        return {
+    )
+    version_body = json_dumps_canonical(
+        {
             "version": __version__,
             "python_version": "3.11+",
             "otel_enabled": settings.otel_enabled,
             "auth_enabled": settings.auth.enabled,
         }
+    )
+
+    # Define root endpoint BEFORE mounting MCP app
+    @app.get("/", response_class=JSONResponse)
+    async def root():
+        """Root endpoint with API information."""
+        return Response(content=root_body, media_type="application/json")
+
+    @app.get("/version", response_class=JSONResponse)
+    async def version():
+        """Version information endpoint."""
+        return Response(content=version_body, media_type="application/json")
 
     # Register routers (order matters - health/oauth/device are public, chat may require auth)
     app.include_router(health_router)     # /health, /status - public
@@ -120,8 +146,12 @@ def create_app() -> FastAPI:
     return app
 
 
-# Create application instance
-app = create_app()
+def __getattr__(name: str):
+    """Create the application instance on first access (e.g. by uvicorn)."""
+    if name == "app":
+        app = globals()["app"] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Main entry point for uvicorn
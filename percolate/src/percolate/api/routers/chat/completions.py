@@ -1,7 +1,7 @@
 """OpenAI-compatible chat completions router."""
 
+import secrets
 import time
-import uuid
 
 from fastapi import APIRouter, Depends, Header, HTTPException
 from fastapi.responses import StreamingResponse
@@ -10,7 +10,7 @@ from loguru import logger
 from percolate.agents.context import AgentContext
 from percolate.agents.factory import create_agent
 from percolate.agents.registry import load_agentlet_schema
-from percolate.api.routers.chat.dependencies import get_session_store
+from percolate.api.routers.chat.dependencies import get_session_writer
 from percolate.api.routers.chat.models import (
     ChatCompletionRequest,
     ChatCompletionResponse,
@@ -18,12 +18,19 @@ from percolate.api.routers.chat.models import (
     ChatCompletionUsage,
     ChatMessage,
 )
+from percolate.api.routers.chat.session_writer import SessionWriter
 from percolate.api.routers.chat.streaming import stream_openai_response
-from percolate.memory import SessionStore
 from percolate.otel import get_current_trace_context
 
 router = APIRouter(prefix="/v1/chat", tags=["chat"])
 
+# Message roles combined into the agent prompt
+_PROMPT_ROLES = frozenset({"system", "user"})
+
+# Structured output fields used as the response text, and fields left out of it
+_PRIMARY_FIELDS = frozenset({"answer", "content", "response"})
+_HIDDEN_FIELDS = frozenset({"confidence", "tags", "reasoning"})
+
 
 @router.post("/completions", response_model=None)
 async def chat_completions(
@@ -32,7 +39,7 @@ async def chat_completions(
     x_session_id: str | None = Header(default=None, alias="X-Session-Id"),
     x_user_id: str | None = Header(default=None, alias="X-User-Id"),
     x_project_name: str | None = Header(default=None, alias="X-Project-Name"),
-    session_store: SessionStore | None = Depends(get_session_store),
+    session_writer: SessionWriter | None = Depends(get_session_writer),
 ):
     """
     OpenAI-compatible chat completions with agent-let support.
@@ -101,14 +108,18 @@ async def chat_completions(
     agent_uri = body.agent_uri or body.model
 
     # Build prompt from messages (combine system and user messages)
-    prompt = "\n".join(msg.content or "" for msg in body.messages if msg.role in ("system", "user"))
+    prompt = "\n".join([msg.content for msg in body.messages if msg.role in _PROMPT_ROLES and msg.content])
 
     # Generate request ID
-    request_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+    request_id = f"chatcmpl-{secrets.token_hex(12)}"
 
+    # Arguments are formatted by loguru only if the record is emitted
     logger.info(
-        f"Chat completion request: agent={agent_uri}, tenant={x_tenant_id}, "
-        f"session={x_session_id}, stream={body.stream}"
+        "Chat completion request: agent={}, tenant={}, session={}, stream={}",
+        agent_uri,
+        x_tenant_id,
+        x_session_id,
+        body.stream,
     )
 
     try:
@@ -123,9 +134,9 @@ async def chat_completions(
             metadata={"source": "api"},
         )
 
-        # Save user message to session (if tracking enabled)
-        if session_store and x_session_id:
-            session_store.save_message(
+        # Queue user message for saving to session (if tracking enabled)
+        if session_writer and x_session_id:
+            session_writer.enqueue(
                 session_id=x_session_id,
                 tenant_id=x_tenant_id,
                 role="user",
@@ -166,16 +177,17 @@ async def chat_completions(
 
         # If response is structured output (dict/BaseModel), convert to string
         if isinstance(response_content, dict):
-            # Format structured output as readable text
-            formatted_parts = []
+            # Format structured output as readable text: main content
+            # fields first, then other fields as metadata
+            primary_parts = []
+            metadata_parts = []
             for key, value in response_content.items():
-                if key in ("answer", "content", "response"):
-                    # Main content field - use as primary response
-                    formatted_parts.insert(0, str(value))
-                elif key not in ("confidence", "tags", "reasoning"):
-                    # Other fields - append as metadata
-                    formatted_parts.append(f"{key}: {value}")
+                if key in _PRIMARY_FIELDS:
+                    primary_parts.append(str(value))
+                elif key not in _HIDDEN_FIELDS:
+                    metadata_parts.append(f"{key}: {value}")
 
+            formatted_parts = primary_parts + metadata_parts
             response_text = "\n\n".join(formatted_parts) if formatted_parts else str(response_content)
         else:
             response_text = str(response_content)
@@ -192,9 +204,9 @@ async def chat_completions(
         all_messages = result.all_messages()
         model_name = all_messages[0].model_name if all_messages else body.model
 
-        # Save assistant response to session (if tracking enabled)
-        if session_store and x_session_id:
-            session_store.save_message(
+        # Queue assistant response for saving to session (if tracking enabled)
+        if session_writer and x_session_id:
+            session_writer.enqueue(
                 session_id=x_session_id,
                 tenant_id=x_tenant_id,
                 role="assistant",
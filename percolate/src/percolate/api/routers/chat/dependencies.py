@@ -2,18 +2,58 @@
 
 from fastapi import Header
 
+from percolate.api.routers.chat.session_writer import SessionWriter
 from percolate.memory import SessionStore
 
+# Global session store and writer (lazy-initialized)
+_session_store_instance: SessionStore | None = None
+_session_writer_instance: SessionWriter | None = None
 
-def get_session_store(
+
+def get_session_store_instance() -> SessionStore:
+    """Get or create the global SessionStore.
+
+    Lazy-initializes the store on first call and reuses it for every
+    subsequent request instead of building one per request.
+
+    Returns:
+        Cached SessionStore instance
+    """
+    global _session_store_instance
+
+    if _session_store_instance is None:
+        _session_store_instance = SessionStore()
+
+    return _session_store_instance
+
+
+def get_session_writer(
     x_session_id: str | None = Header(default=None, alias="X-Session-Id"),
-) -> SessionStore | None:
-    """Get SessionStore instance if session tracking is enabled.
+) -> SessionWriter | None:
+    """Get the global SessionWriter if session tracking is enabled.
 
     Args:
         x_session_id: Optional session ID from request header
 
     Returns:
-        SessionStore instance if session_id provided, None otherwise
+        SessionWriter (batching saves to the global SessionStore) if
+        session_id provided, None otherwise
     """
-    return SessionStore() if x_session_id else None
+    global _session_writer_instance
+
+    if not x_session_id:
+        return None
+
+    if _session_writer_instance is None:
+        _session_writer_instance = SessionWriter(get_session_store_instance())
+
+    return _session_writer_instance
+
+
+async def close_session_writer() -> None:
+    """Save queued session messages and stop the global SessionWriter (on shutdown)."""
+    global _session_writer_instance
+
+    if _session_writer_instance is not None:
+        await _session_writer_instance.close()
+        _session_writer_instance = None
@@ -1,12 +1,14 @@
 """Feedback endpoint for chat completions."""
 
+import asyncio
 from typing import Any, Literal
 
-from fastapi import Header, HTTPException
+from fastapi import Depends, Header, HTTPException
 from loguru import logger
 from pydantic import BaseModel, Field
 
 from percolate.api.routers.chat.completions import router
+from percolate.api.routers.chat.dependencies import get_session_store_instance
 from percolate.memory import SessionStore
 
 
@@ -36,6 +38,7 @@ async def submit_feedback(
     body: FeedbackRequest,
     x_tenant_id: str = Header(default="default", alias="X-Tenant-Id"),
     x_user_id: str | None = Header(default=None, alias="X-User-Id"),
+    session_store: SessionStore = Depends(get_session_store_instance),
 ):
     """Submit user feedback on an assistant interaction.
 
@@ -47,14 +50,17 @@ async def submit_feedback(
         Custom: {"session_id": "...", "score": 0.75, "label": "good_but_slow"}
     """
     logger.info(
-        f"Feedback submission: session={body.session_id}, tenant={x_tenant_id}, "
-        f"score={body.score}, label={body.label}"
+        "Feedback submission: session={}, tenant={}, score={}, label={}",
+        body.session_id,
+        x_tenant_id,
+        body.score,
+        body.label,
     )
 
-    session_store = SessionStore()
-
     try:
-        feedback_id = session_store.save_feedback(
+        # Database write runs in a worker thread so it doesn't block the event loop
+        feedback_id = await asyncio.to_thread(
+            session_store.save_feedback,
             session_id=body.session_id,
             tenant_id=x_tenant_id,
             label=body.label,
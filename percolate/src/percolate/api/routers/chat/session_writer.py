@@ -0,0 +1,101 @@
+"""Background batching of chat session writes.
+
+Chat completions enqueue messages instead of writing them in the request
+path. A background task collects messages that arrive within a short
+window (up to max_batch) and saves them with SessionStore.save_messages,
+off the event loop.
+
+Messages are persisted up to max_latency_ms (plus the write itself) after
+the response returns, so a read made immediately after a response may not
+see them yet.
+
+Usage:
+    writer = SessionWriter(session_store)
+    writer.enqueue(session_id="s1", tenant_id="t1", role="user", content="Hi")
+    ...
+    await writer.close()  # Flush pending messages on shutdown
+"""
+
+import asyncio
+from typing import Any
+
+from loguru import logger
+
+from percolate.memory import SessionStore
+from percolate.memory.utils import utc_timestamp
+
+# Queued by close() after the pending messages: the task flushes them and exits
+_STOP: dict[str, Any] = {}
+
+
+class SessionWriter:
+    """Queue of session messages saved in batches by a background task.
+
+    Saves are eventually consistent: a queued message reaches the store up
+    to max_latency_ms after it is enqueued (i.e. after the response returns).
+    """
+
+    def __init__(
+        self,
+        session_store: SessionStore,
+        max_batch: int = 64,
+        max_latency_ms: float = 20,
+    ):
+        """Initialize session writer.
+
+        Args:
+            session_store: Store the batches are saved to
+            max_batch: Maximum messages per batch
+            max_latency_ms: How long the first message of a batch waits for others
+        """
+        self.session_store = session_store
+        self.max_batch = max_batch
+        self.max_latency = max_latency_ms / 1000
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+        self._closing = asyncio.Event()
+
+    def enqueue(self, **message: Any) -> None:
+        """Queue a message for saving (takes SessionStore.save_message arguments).
+
+        The message is timestamped now, so batching doesn't change message
+        order or times.
+        """
+        message.setdefault("timestamp", utc_timestamp())
+        self._queue.put_nowait(message)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Save any queued messages and stop the background task."""
+        if self._task is not None:
+            self._closing.set()
+            self._queue.put_nowait(_STOP)
+            await self._task
+            self._task = None
+            self._closing.clear()
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            if batch[0] is not _STOP:
+                # Let messages from concurrent requests join the batch
+                # (cut short when closing)
+                try:
+                    await asyncio.wait_for(self._closing.wait(), self.max_latency)
+                except TimeoutError:
+                    pass
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            messages = [message for message in batch if message is not _STOP]
+            if messages:
+                await self._flush(messages)
+            if len(messages) < len(batch):
+                return
+
+    async def _flush(self, messages: list[dict[str, Any]]) -> None:
+        try:
+            await asyncio.to_thread(self.session_store.save_messages, messages)
+        except Exception as e:
+            logger.error(f"Failed to save {len(messages)} session messages: {e}")
@@ -1,8 +1,8 @@
 """OpenAI-compatible streaming relay for Pydantic AI agents."""
 
 import json
+import secrets
 import time
-import uuid
 from typing import AsyncGenerator
 
 from loguru import logger
@@ -38,7 +38,7 @@ async def stream_openai_response(
         SSE-formatted strings: "data: {json}\\n\\n"
     """
     if request_id is None:
-        request_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        request_id = f"chatcmpl-{secrets.token_hex(12)}"
 
     created_at = int(time.time())
     is_first_chunk = True
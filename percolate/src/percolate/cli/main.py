@@ -3,6 +3,7 @@
 import asyncio
 import json
 import uuid
+from enum import StrEnum
 from pathlib import Path
 
 import typer
@@ -27,11 +28,28 @@ except ImportError:
     pass  # rem_db not installed, skip
 
 
+class LogLevel(StrEnum):
+    """Log levels accepted by uvicorn."""
+
+    CRITICAL = "critical"
+    ERROR = "error"
+    WARNING = "warning"
+    INFO = "info"
+    DEBUG = "debug"
+    TRACE = "trace"
+
+
 @app.command()
 def serve(
     host: str = typer.Option("0.0.0.0", help="API server host"),
     port: int = typer.Option(8000, help="API server port"),
     reload: bool = typer.Option(False, help="Auto-reload on code changes"),
+    workers: int = typer.Option(
+        1, min=1, help="Worker processes (ignored with --reload; requires no embedded REM database)"
+    ),
+    log_level: LogLevel = typer.Option(
+        LogLevel.INFO, case_sensitive=False, help="Server log level (use warning in production)"
+    ),
 ) -> None:
     """Start the Percolate API server with integrated MCP endpoint.
 
@@ -41,13 +59,27 @@ def serve(
     - Health check at /health
     - OpenAPI docs at /docs
 
+    The embedded REM database (RocksDB) takes an exclusive lock on its
+    directory, so only one process can open it: --workers > 1 is refused
+    while percolate-rocks is installed.
+
     Examples:
         percolate serve
         percolate serve --reload
         percolate serve --host 127.0.0.1 --port 8080
+        percolate serve --log-level warning
     """
     import uvicorn
 
+    from percolate.memory.database import REM_DB_AVAILABLE
+
+    if workers > 1 and not reload and REM_DB_AVAILABLE:
+        console.print(
+            "[red]Error:[/red] --workers > 1 is not supported with the embedded REM database "
+            "(each worker would try to lock the same RocksDB directory)"
+        )
+        raise typer.Exit(code=1)
+
     console.print(f"[green]Starting Percolate API server on {host}:{port}[/green]")
     console.print(f"[dim]API endpoint:[/dim] http://{host}:{port}/v1/agents/eval")
     console.print(f"[dim]MCP endpoint:[/dim] http://{host}:{port}/mcp")
@@ -58,6 +90,10 @@ def serve(
         host=host,
         port=port,
         reload=reload,
+        workers=None if reload else workers,
+        log_level=log_level.value,
+        # Per-request access log lines are costly under load
+        access_log=log_level in (LogLevel.DEBUG, LogLevel.TRACE),
     )
 
 
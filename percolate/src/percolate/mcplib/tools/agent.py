@@ -1,5 +1,6 @@
 """Agent management MCP tools."""
 
+import asyncio
 import json
 from typing import Any
 
@@ -85,12 +86,13 @@ async def ask_agent(
         'success'
     """
     try:
-        # Initialize session store
-        session_store = SessionStore()
+        # Session store is only needed when tracking history
+        session_store = SessionStore() if session_id else None
 
-        # Save user message to session (if session_id provided)
+        # Save user message to session (if session_id provided), off the event loop
         if session_id:
-            session_store.save_message(
+            await asyncio.to_thread(
+                session_store.save_message,
                 session_id=session_id,
                 tenant_id=tenant_id,
                 role="user",
@@ -168,7 +170,8 @@ async def ask_agent(
 
         # Save assistant response to session (if session_id provided)
         if session_id:
-            session_store.save_message(
+            await asyncio.to_thread(
+                session_store.save_message,
                 session_id=session_id,
                 tenant_id=tenant_id,
                 role="assistant",
@@ -104,7 +104,7 @@ class SessionStore:
         logger.debug(f"Upserted session {session_data['session_id']} (entity: {entity_id})")
         return entity_id
 
-    def _insert_message(
+    def _message_data(
         self,
         session_id: str,
         tenant_id: str,
@@ -115,8 +115,8 @@ class SessionStore:
         usage: dict[str, int] | None = None,
         trace_id: str | None = None,
         span_id: str | None = None,
-    ) -> str:
-        """Insert message to database.
+    ) -> dict[str, Any]:
+        """Build message data dict (with a new message ID) for insert.
 
         Args:
             session_id: Parent session identifier
@@ -130,11 +130,10 @@ class SessionStore:
             span_id: Optional OTEL span ID
 
         Returns:
-            Message ID (UUID)
+            Message data dictionary for database insert
         """
-        message_id = str(uuid.uuid4())
-        message_data = {
-            "message_id": message_id,
+        return {
+            "message_id": str(uuid.uuid4()),
             "session_id": session_id,
             "tenant_id": tenant_id,
             "role": role,
@@ -146,6 +145,39 @@ class SessionStore:
             "span_id": span_id,
         }
 
+    def _insert_message(
+        self,
+        session_id: str,
+        tenant_id: str,
+        role: str,
+        content: str,
+        timestamp: str,
+        model: str | None = None,
+        usage: dict[str, int] | None = None,
+        trace_id: str | None = None,
+        span_id: str | None = None,
+    ) -> str:
+        """Insert message to database.
+
+        Args:
+            session_id: Parent session identifier
+            tenant_id: Tenant scope
+            role: Message role
+            content: Message content
+            timestamp: ISO 8601 timestamp
+            model: Optional model identifier
+            usage: Optional token usage metrics
+            trace_id: Optional OTEL trace ID
+            span_id: Optional OTEL span ID
+
+        Returns:
+            Message ID (UUID)
+        """
+        message_data = self._message_data(
+            session_id, tenant_id, role, content, timestamp, model, usage, trace_id, span_id
+        )
+        message_id = message_data["message_id"]
+
         entity_id = self.db.insert(TABLE_MESSAGES, message_data)
         logger.debug(f"Inserted message {message_id} to session {session_id} (entity: {entity_id})")
         return message_id
@@ -206,6 +238,64 @@ class SessionStore:
             logger.error(f"Failed to save message: {e}")
             return None
 
+    def save_messages(self, messages: list[dict[str, Any]]) -> list[str | None]:
+        """Save several messages with one batch insert per table.
+
+        Equivalent to calling save_message for each message in order, but
+        each session is looked up and upserted once per batch.
+
+        Args:
+            messages: save_message keyword arguments per message, plus an
+                optional "timestamp" (ISO 8601, defaults to now)
+
+        Returns:
+            Message IDs in input order if successful, Nones otherwise
+        """
+        if not self.db:
+            logger.debug(f"Skipping session save (db unavailable): {len(messages)} messages")
+            return [None] * len(messages)
+
+        try:
+            sessions: dict[tuple[str, str], dict[str, Any]] = {}
+            message_rows = []
+
+            for message in messages:
+                session_id = message["session_id"]
+                tenant_id = message["tenant_id"]
+                timestamp = message.get("timestamp") or utc_timestamp()
+
+                session_data = sessions.get((session_id, tenant_id))
+                if session_data is None:
+                    existing_session = self.get_session(session_id, tenant_id)
+                    sessions[(session_id, tenant_id)] = self._build_session_data(
+                        session_id, tenant_id, message.get("agent_uri"), message.get("metadata"),
+                        existing_session, timestamp,
+                    )
+                else:
+                    # Same update save_message would apply on top of the previous message
+                    session_data["agent_uri"] = message.get("agent_uri") or session_data["agent_uri"]
+                    session_data["metadata"] = message.get("metadata") or session_data["metadata"]
+                    session_data["message_count"] += 1
+                    session_data["updated_at"] = timestamp
+
+                message_rows.append(
+                    self._message_data(
+                        session_id, tenant_id, message["role"], message["content"], timestamp,
+                        message.get("model"), message.get("usage"),
+                        message.get("trace_id"), message.get("span_id"),
+                    )
+                )
+
+            self.db.insert_batch(TABLE_SESSIONS, list(sessions.values()))
+            self.db.insert_batch(TABLE_MESSAGES, message_rows)
+            logger.debug(f"Inserted {len(message_rows)} messages to {len(sessions)} sessions")
+
+            return [row["message_id"] for row in message_rows]
+
+        except Exception as e:
+            logger.error(f"Failed to save messages: {e}")
+            return [None] * len(messages)
+
     def get_session(self, session_id: str, tenant_id: str) -> ChatSession | None:
         """Retrieve session metadata by ID.
 
@@ -234,7 +324,7 @@ class SessionStore:
                 )
                 return None
 
-            return ChatSession(**session_dict)
+            return ChatSession.from_trusted_row(session_dict)
 
         except Exception as e:
             logger.error(f"Failed to retrieve session {session_id}: {e}")
@@ -7,6 +7,12 @@ from percolate.utils.chunking import (
     estimate_tokens,
     get_optimal_chunk_size,
     is_list_content,
+    token_offsets,
+)
+from percolate.utils.serialization import (
+    json_dumps_canonical,
+    json_dumps_indented,
+    json_loads,
 )
 
 __all__ = [
@@ -16,4 +22,8 @@ __all__ = [
     "estimate_tokens",
     "get_optimal_chunk_size",
     "is_list_content",
+    "json_dumps_canonical",
+    "json_dumps_indented",
+    "json_loads",
+    "token_offsets",
 ]
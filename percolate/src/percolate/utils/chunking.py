@@ -21,11 +21,15 @@ Usage:
 
 from __future__ import annotations
 
-import json
+import re
+from bisect import bisect_left
+from functools import cache
 from typing import Any, Optional
 
 from loguru import logger
 
+from percolate.utils.serialization import json_dumps_indented, json_loads
+
 # Model context windows (in tokens)
 MODEL_CONTEXT_WINDOWS = {
     # Anthropic
@@ -51,6 +55,20 @@ DEFAULT_OUTPUT_SCHEMA_OVERHEAD = 500
 DEFAULT_RESPONSE_BUFFER_RATIO = 0.2
 JSON_RECORD_OVERHEAD = 5
 
+# Model names -> tiktoken encodings
+# Claude models use cl100k_base encoding (same as GPT-4)
+TIKTOKEN_ENCODINGS = {
+    "claude-sonnet-4-5": "cl100k_base",
+    "claude-opus-4": "cl100k_base",
+    "claude-haiku-4-5": "cl100k_base",
+    "gpt-4.1": "cl100k_base",
+    "gpt-5": "cl100k_base",
+    "gpt-4o": "cl100k_base",
+}
+
+# Sentence boundary: . ! ? followed by space and capital letter
+_SENTENCE_END = re.compile(r"([.!?]+)\s+(?=[A-Z])")
+
 
 def get_optimal_chunk_size(
     model_name: str,
@@ -92,6 +110,23 @@ def get_optimal_chunk_size(
     return usable_tokens
 
 
+@cache
+def _get_encoding(model_name: str) -> Any | None:
+    """tiktoken encoding for a model, or None if tiktoken can't be used.
+
+    Loaded once per model, so the fallback warning is logged once too.
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(TIKTOKEN_ENCODINGS.get(model_name, "cl100k_base"))
+    except ImportError:
+        logger.warning("tiktoken not available, using character-based estimation")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding failed to load: {e}, using character-based estimation")
+    return None
+
+
 def estimate_tokens(content: str, model_name: str) -> int:
     """Estimate token count for content.
 
@@ -109,51 +144,79 @@ def estimate_tokens(content: str, model_name: str) -> int:
         >>> estimate_tokens("Hello world", "claude-sonnet-4-5")
         2
     """
-    try:
-        import tiktoken
+    encoding = _get_encoding(model_name)
+    if encoding is not None:
+        try:
+            return len(encoding.encode(content, disallowed_special=()))
+        except Exception as e:
+            logger.warning(f"Token estimation failed: {e}, using character-based estimation")
 
-        # Map model names to tiktoken encodings
-        # Claude models use cl100k_base encoding (same as GPT-4)
-        encoding_map = {
-            "claude-sonnet-4-5": "cl100k_base",
-            "claude-opus-4": "cl100k_base",
-            "claude-haiku-4-5": "cl100k_base",
-            "gpt-4.1": "cl100k_base",
-            "gpt-5": "cl100k_base",
-            "gpt-4o": "cl100k_base",
-        }
+    # Fallback to character-based estimation (~4 chars per token)
+    return len(content) // 4
 
-        encoding_name = encoding_map.get(model_name, "cl100k_base")
-        encoding = tiktoken.get_encoding(encoding_name)
-        return len(encoding.encode(content))
-    except ImportError:
-        # Fallback to character-based estimation (~4 chars per token)
-        logger.warning("tiktoken not available, using character-based estimation")
-        return len(content) // 4
-    except Exception as e:
-        logger.warning(f"Token estimation failed: {e}, using character-based estimation")
-        return len(content) // 4
+
+def token_offsets(content: str, model_name: str) -> list[int]:
+    """Character offset at which each token of content starts.
+
+    Tokenizes content once. The token count of any span of content is then
+    a bisect over the offsets, so chunking never re-tokenizes sentences or
+    chunks. Without tiktoken, tokens are 4-character runs (matching the
+    estimate_tokens fallback).
+
+    Args:
+        content: Text to tokenize
+        model_name: Model for tokenization
+
+    Returns:
+        Ascending start offsets, one per token
+
+    Example:
+        >>> offsets = token_offsets("Hello world", "claude-sonnet-4-5")
+        >>> offsets
+        [0, 5]
+    """
+    encoding = _get_encoding(model_name)
+    if encoding is not None:
+        try:
+            tokens = encoding.encode(content, disallowed_special=())
+            return encoding.decode_with_offsets(tokens)[1]
+        except Exception as e:
+            logger.warning(f"Tokenization failed: {e}, using character-based estimation")
+
+    return list(range(0, len(content) - 3, 4))
 
 
 def chunk_by_tokens(
     content: str,
     model_name: str,
     max_chunk_tokens: Optional[int] = None,
+    overlap_tokens: int = 0,
 ) -> list[str]:
     """Split content by token boundaries.
 
     Uses tiktoken for accurate token counting and splits content into chunks
     that fit within the specified token limit. Attempts to split on sentence
-    boundaries where possible to maintain coherence.
+    boundaries where possible to maintain coherence. Content is tokenized
+    once (see token_offsets); sentences longer than a chunk are cut at token
+    boundaries.
+
+    With overlap_tokens, each chunk repeats the trailing sentences (up to
+    overlap_tokens) of the previous one, so facts spanning a boundary are
+    seen whole by at least one chunk. Pieces of a cut sentence overlap by
+    overlap_tokens tokens.
 
     Args:
         content: Text to chunk
         model_name: Model for token counting
         max_chunk_tokens: Override optimal chunk size
+        overlap_tokens: Tokens repeated from the end of the previous chunk
 
     Returns:
         List of text chunks, each within token limit
 
+    Raises:
+        ValueError: If overlap_tokens is not smaller than the chunk size
+
     Example:
         >>> chunks = chunk_by_tokens(long_text, "claude-sonnet-4-5")
         >>> all(estimate_tokens(c, "claude-sonnet-4-5") <= get_optimal_chunk_size("claude-sonnet-4-5") for c in chunks)
@@ -161,9 +224,12 @@ def chunk_by_tokens(
     """
     # Calculate chunk size if not provided
     chunk_size = max_chunk_tokens or get_optimal_chunk_size(model_name)
+    if not 0 <= overlap_tokens < chunk_size:
+        raise ValueError(f"overlap_tokens must be in [0, {chunk_size}), got {overlap_tokens}")
 
     # Check if content fits in single chunk
-    total_tokens = estimate_tokens(content, model_name)
+    offsets = token_offsets(content, model_name)
+    total_tokens = len(offsets)
     if total_tokens <= chunk_size:
         logger.debug(f"Content fits in single chunk ({total_tokens} tokens)")
         return [content]
@@ -171,102 +237,83 @@ def chunk_by_tokens(
     logger.info(f"Splitting content ({total_tokens} tokens) into chunks of {chunk_size} tokens")
 
     chunks = []
-    current_chunk = ""
+    # (start, end, tokens) of the sentences (or sentence pieces) in the current chunk
+    current: list[tuple[int, int, int]] = []
     current_tokens = 0
 
     # Split on sentences for better coherence
-    sentences = _split_into_sentences(content)
-
-    for sentence in sentences:
-        sentence_tokens = estimate_tokens(sentence, model_name)
-
-        # If single sentence exceeds chunk size, split it further
-        if sentence_tokens > chunk_size:
-            # Save current chunk if non-empty
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-                current_chunk = ""
-                current_tokens = 0
-
-            # Split long sentence by character chunks
-            char_chunks = _split_by_characters(sentence, chunk_size, model_name)
-            chunks.extend(char_chunks[:-1])
-
-            # Start new chunk with last piece
-            current_chunk = char_chunks[-1]
-            current_tokens = estimate_tokens(current_chunk, model_name)
-
-        # Check if adding this sentence would exceed limit
-        elif current_tokens + sentence_tokens > chunk_size:
-            # Save current chunk and start new one
-            chunks.append(current_chunk.strip())
-            current_chunk = sentence
-            current_tokens = sentence_tokens
-        else:
-            # Add sentence to current chunk
-            current_chunk += (" " if current_chunk else "") + sentence
-            current_tokens += sentence_tokens
+    for start, end in _sentence_spans(content):
+        first_token = bisect_left(offsets, start)
+        end_token = bisect_left(offsets, end)
+
+        # If single sentence exceeds chunk size, cut it at token boundaries
+        segments = [(start, end, end_token - first_token)]
+        if end_token - first_token > chunk_size:
+            segments = []
+            for t in range(first_token, end_token, chunk_size - overlap_tokens):
+                piece_end = min(t + chunk_size, end_token)
+                segments.append(
+                    (
+                        offsets[t] if t > first_token else start,
+                        offsets[piece_end] if piece_end < end_token else end,
+                        piece_end - t,
+                    )
+                )
+                if piece_end == end_token:
+                    break
+
+        for segment in segments:
+            # Save current chunk and start new one if this would exceed limit
+            if current and current_tokens + segment[2] > chunk_size:
+                chunks.append(_join_segments(content, current))
+                current = _overlap_tail(current, min(overlap_tokens, chunk_size - segment[2]))
+                current_tokens = sum(tokens for _, _, tokens in current)
+            current.append(segment)
+            current_tokens += segment[2]
 
     # Add final chunk if non-empty
-    if current_chunk.strip():
-        chunks.append(current_chunk.strip())
+    last_chunk = _join_segments(content, current)
+    if last_chunk:
+        chunks.append(last_chunk)
 
     logger.info(f"Created {len(chunks)} chunks")
     return chunks
 
 
-def _split_into_sentences(text: str) -> list[str]:
-    """Split text into sentences on common sentence boundaries.
+def _join_segments(content: str, segments: list[tuple[int, int, int]]) -> str:
+    """Text of a chunk: its sentences joined by single spaces."""
+    return " ".join(content[start:end] for start, end, _ in segments).strip()
 
-    Args:
-        text: Text to split
 
-    Returns:
-        List of sentences
-    """
-    # Simple sentence splitting on common terminators
-    # This is a basic approach - could be enhanced with NLTK or spacy
-    import re
-
-    # Split on . ! ? followed by space and capital letter
-    sentences = re.split(r'([.!?]+)\s+(?=[A-Z])', text)
-
-    # Recombine punctuation with sentences
-    result = []
-    for i in range(0, len(sentences) - 1, 2):
-        if i + 1 < len(sentences):
-            result.append(sentences[i] + sentences[i + 1])
-        else:
-            result.append(sentences[i])
-
-    # Add last part if exists
-    if len(sentences) % 2 == 1:
-        result.append(sentences[-1])
-
-    return [s for s in result if s.strip()]
+def _overlap_tail(segments: list[tuple[int, int, int]], max_tokens: int) -> list[tuple[int, int, int]]:
+    """Trailing segments of a chunk totalling at most max_tokens tokens."""
+    tokens = 0
+    for i in range(len(segments) - 1, -1, -1):
+        tokens += segments[i][2]
+        if tokens > max_tokens:
+            return segments[i + 1 :]
+    return list(segments)
 
 
-def _split_by_characters(text: str, max_tokens: int, model_name: str) -> list[str]:
-    """Split text by character boundaries when sentence splitting isn't enough.
+def _sentence_spans(text: str) -> list[tuple[int, int]]:
+    """Find sentences on common sentence boundaries.
 
     Args:
         text: Text to split
-        max_tokens: Maximum tokens per chunk
-        model_name: Model for token counting
 
     Returns:
-        List of text chunks
+        (start, end) offsets of each non-blank sentence, punctuation included
     """
-    # Estimate characters per token (rough approximation)
-    avg_chars_per_token = len(text) / estimate_tokens(text, model_name)
-    chunk_chars = int(max_tokens * avg_chars_per_token * 0.9)  # 90% to be safe
-
-    chunks = []
-    for i in range(0, len(text), chunk_chars):
-        chunk = text[i:i + chunk_chars]
-        chunks.append(chunk)
+    # Simple sentence splitting on common terminators
+    # This is a basic approach - could be enhanced with NLTK or spacy
+    spans = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        spans.append((start, match.end(1)))
+        start = match.end()
+    spans.append((start, len(text)))
 
-    return chunks
+    return [(start, end) for start, end in spans if text[start:end].strip()]
 
 
 def is_list_content(content: str | list) -> bool:
@@ -289,12 +336,12 @@ def is_list_content(content: str | list) -> bool:
     if isinstance(content, list):
         return True
 
-    # Try parsing as JSON array
-    if isinstance(content, str):
+    # Try parsing as JSON array (plain text is rejected without parsing)
+    if isinstance(content, str) and content.lstrip().startswith("["):
         try:
-            parsed = json.loads(content)
+            parsed = json_loads(content)
             return isinstance(parsed, list)
-        except (json.JSONDecodeError, ValueError):
+        except ValueError:
             return False
 
     return False
@@ -340,7 +387,7 @@ def chunk_by_records(
     chunks = []
     for i in range(0, len(content), max_records_per_chunk):
         chunk_records = content[i:i + max_records_per_chunk]
-        chunk_json = json.dumps(chunk_records, indent=2)
+        chunk_json = json_dumps_indented(chunk_records)
         chunks.append(chunk_json)
 
     logger.info(f"Created {len(chunks)} record chunks")
@@ -386,7 +433,7 @@ def estimate_record_count(
     # Sample first 10 records to estimate average size
     sample_size = min(10, len(content))
     sample = content[:sample_size]
-    sample_json = json.dumps(sample, indent=2)
+    sample_json = json_dumps_indented(sample)
     sample_tokens = estimate_tokens(sample_json, model_name)
 
     # Calculate average tokens per record (including JSON overhead)
@@ -0,0 +1,32 @@
+"""JSON helpers backed by orjson.
+
+orjson parses and serializes large documents several times faster than the
+stdlib json module, and its output is the same on every install, so digests
+built from it are stable.
+
+Usage:
+    records = json_loads(payload)
+    text = json_dumps_indented(records)
+    digest = hashlib.sha256(json_dumps_canonical(schema)).hexdigest()
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse a JSON document."""
+    return orjson.loads(data)
+
+
+def json_dumps_indented(obj: Any) -> str:
+    """Serialize to human/LLM-readable JSON with 2-space indentation."""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+
+def json_dumps_canonical(obj: Any) -> bytes:
+    """Serialize to compact key-sorted JSON bytes, for hashing and cache keys."""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,192 @@
+"""Unit tests for agent factory model and schema helpers.
+
+Tests dynamic model creation and schema wrapping without creating agents
+or calling an LLM.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from percolate.agents import factory
+from percolate.agents.context import AgentContext
+from percolate.agents.factory import _create_model_from_schema, _create_schema_wrapper
+
+AGENT_SCHEMA = {
+    "title": "Answerer",
+    "description": "Answer the question.",
+    "properties": {
+        "answer": {"type": "string", "description": "The answer"},
+        "confidence": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+    },
+    "required": ["answer", "confidence"],
+}
+
+
+class TestModelFromSchema:
+    """Test dynamic Pydantic model creation from agent schemas."""
+
+    def test_model_is_built_from_schema(self):
+        """Test that fields and title come from the schema."""
+        model = _create_model_from_schema(AGENT_SCHEMA)
+
+        assert model.__name__ == "Answerer"
+        assert model(answer="42", confidence=0.9).answer == "42"
+
+    def test_identical_schemas_reuse_model(self):
+        """Test that equal schemas (regardless of key order) return the cached class."""
+        reordered = dict(reversed(list(AGENT_SCHEMA.items())))
+
+        assert _create_model_from_schema(AGENT_SCHEMA) is _create_model_from_schema(reordered)
+
+    def test_different_schemas_build_different_models(self):
+        """Test that a changed schema is not served from the cache."""
+        changed = {**AGENT_SCHEMA, "required": ["answer"]}
+
+        assert _create_model_from_schema(changed) is not _create_model_from_schema(AGENT_SCHEMA)
+
+
+class TestSchemaWrapper:
+    """Test the description-stripping result type wrapper."""
+
+    def test_description_is_stripped(self):
+        """Test that the wrapper schema omits the model description."""
+        model = _create_model_from_schema(AGENT_SCHEMA)
+        wrapper = _create_schema_wrapper(model)
+
+        assert "description" not in wrapper.model_json_schema()
+        assert wrapper.__name__ == "Answerer"
+
+    def test_wrapper_is_reused_per_result_type(self):
+        """Test that repeated calls return the same wrapper class."""
+        model = _create_model_from_schema(AGENT_SCHEMA)
+
+        assert _create_schema_wrapper(model) is _create_schema_wrapper(model)
+        assert _create_schema_wrapper(model, strip_description=False) is model
+
+    def test_model_without_description_is_not_wrapped(self):
+        """Test that models whose schema has no description are returned unchanged."""
+        model = _create_model_from_schema({k: v for k, v in AGENT_SCHEMA.items() if k != "description"})
+
+        assert _create_schema_wrapper(model) is model
+
+    def test_wrapper_leaves_result_type_untouched(self):
+        """Test that wrapping sets no attributes on the caller's model."""
+
+        class Report(factory.BaseModel):
+            """A report."""
+
+            summary: str
+
+        before = dict(Report.__dict__)
+        wrapper = _create_schema_wrapper(Report)
+
+        assert wrapper is not Report
+        assert dict(Report.__dict__).keys() == before.keys()
+
+    def test_stripped_schema_is_cached_and_copied(self):
+        """Test that schemas are generated once per kwargs and safe to mutate."""
+        wrapper = _create_schema_wrapper(_create_model_from_schema(AGENT_SCHEMA))
+
+        schema = wrapper.model_json_schema()
+        schema["properties"].clear()
+
+        assert "answer" in wrapper.model_json_schema()["properties"]
+        assert wrapper.model_json_schema(mode="serialization")["title"] == "Answerer"
+
+
+class TestLocalTools:
+    """Test on-demand loading of local MCP tools."""
+
+    def test_unknown_tool_is_skipped(self):
+        """Test that tools outside the local registry build nothing."""
+        assert factory._load_local_tool("not_a_tool") is None
+        assert factory._build_local_tools([{"mcp_server": "percolate", "tool_name": "not_a_tool"}]) == []
+
+    def test_tool_is_wrapped_once_per_function(self):
+        """Test that the Pydantic AI tool for an MCP function is reused."""
+
+        async def lookup(ctx, key: str) -> dict:
+            """Look up a key."""
+            return {}
+
+        assert factory._cached_pydantic_tool(lookup) is factory._cached_pydantic_tool(lookup)
+
+    def test_duplicate_tools_are_built_once(self, monkeypatch):
+        """Test that a tool listed twice yields a single Tool."""
+        monkeypatch.setattr(factory, "_load_local_tool", lambda name: name)
+        monkeypatch.setattr(factory, "_cached_pydantic_tool", lambda func: f"tool:{func}")
+        configs = [
+            {"mcp_server": "percolate", "tool_name": "lookup_entity"},
+            {"mcp_server": "percolate", "tool_name": "parse_document"},
+            {"mcp_server": "default", "tool_name": "lookup_entity"},
+        ]
+
+        assert factory._build_local_tools(configs) == ["tool:lookup_entity", "tool:parse_document"]
+
+    async def test_tools_keep_server_order(self, monkeypatch):
+        """Test that tools from concurrently built servers are returned in config order."""
+        monkeypatch.setattr(factory, "_build_local_tools", lambda configs: [c["tool_name"] for c in configs])
+        configs = [
+            {"mcp_server": "percolate", "tool_name": "a"},
+            {"mcp_server": "remote", "tool_name": "b"},
+            {"mcp_server": "default", "tool_name": "c"},
+            {"mcp_server": "percolate", "tool_name": "d"},
+        ]
+
+        assert await factory._build_mcp_tools(configs) == ["a", "d", "c"]
+
+
+class TestAgentCache:
+    """Test reuse of agents across create_agent calls."""
+
+    @pytest.fixture
+    def agent_cls(self, monkeypatch):
+        """Replace the Pydantic AI Agent with a mock and start from an empty cache."""
+        agent_cls = MagicMock(side_effect=lambda **kwargs: MagicMock())
+        monkeypatch.setattr(factory, "Agent", agent_cls)
+        monkeypatch.setattr(factory, "_AGENT_CACHE", type(factory._AGENT_CACHE)())
+        return agent_cls
+
+    async def test_same_configuration_reuses_agent(self, agent_cls):
+        """Test that identical schema and model names build one agent."""
+        first = await factory.create_agent(agent_schema_override=AGENT_SCHEMA, model_override="test")
+        second = await factory.create_agent(agent_schema_override=dict(AGENT_SCHEMA), model_override="test")
+
+        assert first is second
+        assert agent_cls.call_count == 1
+
+    async def test_different_model_builds_new_agent(self, agent_cls):
+        """Test that the model name is part of the cache key."""
+        first = await factory.create_agent(agent_schema_override=AGENT_SCHEMA, model_override="test")
+        second = await factory.create_agent(agent_schema_override=AGENT_SCHEMA, model_override="other")
+
+        assert first is not second
+        assert agent_cls.call_count == 2
+
+    async def test_schema_is_loaded_from_context_uri(self, agent_cls, monkeypatch):
+        """Test that the agent-let schema is loaded (off the event loop) for the context URI."""
+        loaded = []
+
+        def load(uri, tenant_id):
+            loaded.append((uri, tenant_id))
+            return AGENT_SCHEMA
+
+        monkeypatch.setattr(factory, "load_agentlet_schema", load)
+        context = AgentContext(tenant_id="tenant-1", agent_schema_uri="answerer", default_model="test")
+
+        await factory.create_agent(context)
+
+        assert loaded == [("answerer", "tenant-1")]
+        assert agent_cls.call_args.kwargs["system_prompt"] == "Answer the question."
+
+    async def test_instrumentation_is_set_up_once(self, agent_cls, monkeypatch):
+        """Test that OTEL setup runs on the first create_agent call only."""
+        setup = MagicMock()
+        monkeypatch.setattr(factory, "setup_instrumentation", setup)
+        monkeypatch.setattr(factory, "_instrumentation_ready", False)
+
+        await factory.create_agent(agent_schema_override=AGENT_SCHEMA, model_override="test")
+        await factory.create_agent(agent_schema_override=AGENT_SCHEMA, model_override="other")
+
+        setup.assert_called_once_with()
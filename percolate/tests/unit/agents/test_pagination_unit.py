@@ -4,12 +4,20 @@ Tests the merge strategies without requiring actual agent execution.
 Uses mocked agents to test pagination logic in isolation.
 """
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from pydantic import BaseModel, Field
 
-from percolate.agents.pagination import PaginationConfig, paginated_request, _merge_results
+from percolate.agents.pagination import (
+    LLMCache,
+    PaginationConfig,
+    _merge_results,
+    paginated_request,
+    paginated_request_stream,
+)
 
 
 class TestModel(BaseModel):
@@ -34,9 +42,11 @@ class NestedModel(BaseModel):
 def mock_agent():
     """Create mock agent that returns TestModel."""
 
-    async def mock_run(prompt: str):
+    async def mock_run(prompt: str | list[str]):
         """Mock run that extracts items from prompt."""
-        # Extract chunk content from prompt
+        # Chunks with metadata arrive as [part marker, chunk] content parts
+        if not isinstance(prompt, str):
+            prompt = "\n\n".join(prompt)
         result = MagicMock()
 
         # Parse what chunk this is from prompt
@@ -105,6 +115,43 @@ class TestMergeStrategies:
         # Primitive fields keep first
         assert merged.total == 1
 
+    def test_merge_strategy_merges_nested_models(self):
+        """Test that nested model fields merge recursively and stay models."""
+
+        class Report(BaseModel):
+            result: TestModel
+            sources: list[str]
+
+        results = [
+            Report(result=TestModel(items=["a"], count=1, summary="first"), sources=["s1"]),
+            Report(result=TestModel(items=["b"], count=1, summary="second"), sources=["s2"]),
+            Report(result=TestModel(items=["c"], count=1, summary="third"), sources=["s3"]),
+        ]
+
+        merged = _merge_results(results, "merge")
+
+        assert isinstance(merged.result, TestModel)
+        assert merged.result.items == ["a", "b", "c"]
+        assert merged.result.summary == "first"
+        assert merged.sources == ["s1", "s2", "s3"]
+        assert [r.result.items for r in results] == [["a"], ["b"], ["c"]]
+
+    def test_merge_strategy_leaves_inputs_untouched(self):
+        """Test that merging dicts copies lists and keeps first-seen key order."""
+        first = {"items": ["a"], "meta": {"tags": ["x"]}, "total": 1}
+        second = {"extra": True, "items": ["b"], "meta": {"tags": ["y"], "source": "s"}, "total": 2}
+
+        merged = _merge_results([first, second], "merge")
+
+        assert merged == {
+            "items": ["a", "b"],
+            "meta": {"tags": ["x", "y"], "source": "s"},
+            "total": 1,
+            "extra": True,
+        }
+        assert list(merged) == ["items", "meta", "total", "extra"]
+        assert first == {"items": ["a"], "meta": {"tags": ["x"]}, "total": 1}
+
     def test_concat_strategy_returns_list(self):
         """Test concat strategy returns all results as list."""
         results = [
@@ -219,6 +266,238 @@ class TestPaginationLogic:
         # Should chunk into 4 calls (20 records / 5 per chunk)
         assert mock_agent.run.call_count == 4
 
+    @pytest.mark.asyncio
+    async def test_json_array_text_is_chunked_by_records(self, mock_agent):
+        """Test that a JSON array passed as text is chunked on record boundaries."""
+        records = [{"id": i, "data": f"item{i}"} for i in range(20)]
+        config = PaginationConfig(merge_strategy="concat", chunk_size=5, parallel=False)
+
+        await paginated_request(agent=mock_agent, content=json.dumps(records), config=config)
+
+        prompts = [call.args[0][1] for call in mock_agent.run.call_args_list]
+        assert [json.loads(prompt) for prompt in prompts] == [records[i : i + 5] for i in range(0, 20, 5)]
+
+    @pytest.mark.asyncio
+    async def test_parallel_chunks_respect_max_concurrent(self):
+        """Test that parallel execution never exceeds max_concurrent in-flight calls."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_run(prompt: str):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            result = MagicMock()
+            result.output = TestModel(items=["x"], count=1, summary="chunk")
+            return result
+
+        agent = MagicMock()
+        agent.run = AsyncMock(side_effect=slow_run)
+        records = [{"id": i} for i in range(20)]
+        config = PaginationConfig(merge_strategy="concat", chunk_size=2, max_concurrent=3)
+
+        results = await paginated_request(agent=agent, content=records, config=config)
+
+        assert agent.run.call_count == 10
+        assert len(results) == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_in_completion_order(self):
+        """Test that streamed results arrive as chunks finish, tagged with chunk index."""
+
+        async def run(prompt: list[str]):
+            # Earlier parts finish later
+            marker, _chunk = prompt
+            part = int(marker.split("/")[0].rsplit(" ", 1)[-1])
+            await asyncio.sleep(0.01 * (4 - part))
+            result = MagicMock()
+            result.output = part
+            return result
+
+        agent = MagicMock()
+        agent.run = AsyncMock(side_effect=run)
+        records = [{"id": i} for i in range(6)]
+        config = PaginationConfig(chunk_size=2)
+
+        streamed = [item async for item in paginated_request_stream(agent, records, config)]
+
+        assert streamed == [(2, 3), (1, 2), (0, 1)]
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_early_stops_remaining_chunks(self):
+        """Test that chunks still running are cancelled and awaited when the stream closes."""
+        started = []
+        cancelled = []
+
+        async def run(prompt: list[str]):
+            marker, _chunk = prompt
+            started.append(marker)
+            if "1/" not in marker:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(marker)
+                    raise
+            result = MagicMock()
+            result.output = marker
+            return result
+
+        agent = MagicMock()
+        agent.run = AsyncMock(side_effect=run)
+        records = [{"id": i} for i in range(6)]
+        config = PaginationConfig(chunk_size=2)
+
+        stream = paginated_request_stream(agent, records, config)
+        index, _output = await anext(stream)
+        await stream.aclose()
+
+        assert index == 0
+        assert len(started) == 3
+        assert sorted(cancelled) == sorted(started[1:])
+
+    @pytest.mark.asyncio
+    async def test_merge_follows_chunk_order(self):
+        """Test that outputs merged as they arrive give the same result as merging in chunk order."""
+
+        async def run(prompt: list[str]):
+            marker, _chunk = prompt
+            part = int(marker.split("/")[0].rsplit(" ", 1)[-1])
+            await asyncio.sleep(0.01 * (4 - part))
+            result = MagicMock()
+            result.output = TestModel(items=[f"item{part}"], count=part, summary=f"part {part}")
+            return result
+
+        agent = MagicMock()
+        agent.run = AsyncMock(side_effect=run)
+        records = [{"id": i} for i in range(6)]
+        config = PaginationConfig(merge_strategy="merge", chunk_size=2)
+
+        merged = await paginated_request(agent=agent, content=records, config=config)
+
+        assert merged.items == ["item1", "item2", "item3"]
+        assert merged.summary == "part 1"
+
+    @pytest.mark.asyncio
+    async def test_first_strategy_runs_one_chunk(self, mock_agent):
+        """Test that "first" only runs the chunk whose output it returns."""
+        records = [{"id": i} for i in range(6)]
+        config = PaginationConfig(merge_strategy="first", chunk_size=2)
+
+        await paginated_request(agent=mock_agent, content=records, config=config)
+
+        assert mock_agent.run.call_count == 1
+        marker, chunk = mock_agent.run.call_args.args[0]
+        assert marker == "[Processing part 1/3]"
+        assert json.loads(chunk) == records[:2]
+
+    @pytest.mark.asyncio
+    async def test_chunk_is_sent_as_separate_content_part(self, mock_agent):
+        """Test that the part marker doesn't get concatenated into the chunk text."""
+        records = [{"id": i} for i in range(4)]
+        config = PaginationConfig(merge_strategy="concat", chunk_size=2, parallel=False)
+
+        await paginated_request(agent=mock_agent, content=records, config=config)
+
+        marker, chunk = mock_agent.run.call_args_list[0].args[0]
+        assert marker == "[Processing part 1/2]"
+        assert chunk.lstrip().startswith("[")
+
+
+class TestChunkCache:
+    """Test reuse of chunk outputs across requests."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_content_is_served_from_cache(self, mock_agent):
+        """Test that a second request for the same records skips the agent."""
+        records = [{"id": i} for i in range(6)]
+        cache = LLMCache()
+        config = PaginationConfig(merge_strategy="concat", chunk_size=2, cache=cache)
+        mock_agent.model_settings = {"temperature": 0}
+
+        first = await paginated_request(agent=mock_agent, content=records, config=config)
+        second = await paginated_request(agent=mock_agent, content=records, config=config)
+
+        assert mock_agent.run.call_count == 3
+        assert second == first
+        assert (cache.hits, cache.misses) == (3, 3)
+
+    @pytest.mark.asyncio
+    async def test_same_named_output_models_are_cached_separately(self, mock_agent):
+        """Test that dynamic output models sharing a title don't share cached outputs."""
+        cache = LLMCache()
+        config = PaginationConfig(cache=cache)
+        other_agent = MagicMock()
+        for agent in (mock_agent, other_agent):
+            agent.model, agent._system_prompts = "test-model", ("Summarize.",)
+            agent.model_settings = {"temperature": 0}
+        other_agent.run = mock_agent.run
+        mock_agent.output_type = type("Report", (BaseModel,), {"__annotations__": {"summary": str}})
+        other_agent.output_type = type("Report", (BaseModel,), {"__annotations__": {"total": int}})
+
+        await paginated_request(agent=mock_agent, content="Short text", config=config)
+        await paginated_request(agent=other_agent, content="Short text", config=config)
+
+        assert mock_agent.run.call_count == 2
+        assert cache.hits == 0
+
+    @pytest.mark.asyncio
+    async def test_stochastic_agent_is_not_cached(self, mock_agent):
+        """Test that agents sampling with temperature > 0 always run."""
+        mock_agent.model_settings = {"temperature": 0.7}
+        config = PaginationConfig(cache=LLMCache())
+
+        await paginated_request(agent=mock_agent, content="Short text", config=config)
+        await paginated_request(agent=mock_agent, content="Short text", config=config)
+
+        assert mock_agent.run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_agent_without_temperature_is_not_cached(self, mock_agent):
+        """Test that agents on the provider's default temperature always run."""
+        mock_agent.model_settings = None
+        config = PaginationConfig(cache=LLMCache())
+
+        await paginated_request(agent=mock_agent, content="Short text", config=config)
+        await paginated_request(agent=mock_agent, content="Short text", config=config)
+
+        assert mock_agent.run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_agents_with_different_tools_are_cached_separately(self, mock_agent):
+        """Test that system prompt functions and tools are part of the cache key."""
+
+        def lookup(query: str) -> str:
+            return query
+
+        cache = LLMCache()
+        config = PaginationConfig(cache=cache)
+        other_agent = MagicMock()
+        for agent in (mock_agent, other_agent):
+            agent.model, agent._system_prompts = "test-model", ("Summarize.",)
+            agent.model_settings = {"temperature": 0}
+            agent._system_prompt_functions, agent.output_type = [], str
+            agent._function_toolset.tools = {}
+        other_agent.run = mock_agent.run
+        other_agent._function_toolset.tools = {"lookup": MagicMock(function=lookup)}
+
+        await paginated_request(agent=mock_agent, content="Short text", config=config)
+        await paginated_request(agent=other_agent, content="Short text", config=config)
+
+        assert mock_agent.run.call_count == 2
+        assert cache.hits == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_missed(self):
+        """Test that entries past their ttl are dropped."""
+        cache = LLMCache()
+        await cache.set("key", "value", ttl=0)
+
+        assert await cache.get("key") is None
+        assert cache.misses == 1
+
 
 class TestErrorHandling:
     """Test error handling in pagination."""
@@ -0,0 +1,122 @@
+"""Unit tests for query planner caching.
+
+Uses a mocked planner agent so no LLM is called.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from percolate.agents import query_planner
+from percolate.memory.query_plan import (
+    ExecutionMode,
+    Query,
+    QueryDialect,
+    QueryPlan,
+    QueryType,
+)
+
+
+def make_plan(confidence: float) -> QueryPlan:
+    """Create a LOOKUP plan with the given confidence."""
+    return QueryPlan(
+        query_type=QueryType.LOOKUP,
+        confidence=confidence,
+        primary_query=Query(
+            dialect=QueryDialect.REM_SQL,
+            query_string="LOOKUP 'bob'",
+            parameters={"keys": ["bob"]},
+        ),
+        execution_mode=ExecutionMode.SINGLE_PASS,
+        reasoning="Identifier lookup",
+        explanation=None if confidence >= 0.6 else "Ambiguous",
+    )
+
+
+@pytest.fixture
+def planner(monkeypatch):
+    """Mock planner returning a fixed plan, with an empty plan cache."""
+    agent = MagicMock()
+    agent.run = AsyncMock(return_value=MagicMock(output=make_plan(0.95)))
+    monkeypatch.setattr(query_planner, "create_query_planner", lambda model=None: agent)
+    monkeypatch.setattr(query_planner, "_PLAN_CACHE", type(query_planner._PLAN_CACHE)())
+    return agent
+
+
+class TestPlanCache:
+    """Test reuse of plans for repeated queries."""
+
+    async def test_repeated_query_skips_planner(self, planner):
+        """Test that whitespace and schema order don't defeat the cache."""
+        first = await query_planner.plan_query("Bob", available_schemas=["users", "teams"], model="test")
+        second = await query_planner.plan_query(
+            "  Bob ", available_schemas=["teams", "users"], model="test"
+        )
+
+        assert planner.run.call_count == 1
+        assert second == first
+        assert second is not first
+
+    async def test_query_case_is_part_of_key(self, planner):
+        """Test that queries differing only in case are planned separately."""
+        await query_planner.plan_query("Bob", model="test")
+        await query_planner.plan_query("bob", model="test")
+
+        assert planner.run.call_count == 2
+
+    async def test_schema_hint_is_part_of_key(self, planner):
+        """Test that a different schema hint is planned separately."""
+        await query_planner.plan_query("bob", schema_hint="users", model="test")
+        await query_planner.plan_query("bob", schema_hint="teams", model="test")
+
+        assert planner.run.call_count == 2
+
+    async def test_low_confidence_plans_are_not_cached(self, planner):
+        """Test that ambiguous plans are re-planned."""
+        planner.run.return_value = MagicMock(output=make_plan(0.5))
+
+        await query_planner.plan_query("something", model="test")
+        await query_planner.plan_query("something", model="test")
+
+        assert planner.run.call_count == 2
+
+
+class TestPlannerAgent:
+    """Test reuse of planner agents."""
+
+    def test_agent_is_built_once_per_model(self, monkeypatch):
+        """Test that repeated calls for a model return the same agent."""
+        agent_cls = MagicMock(side_effect=lambda *args, **kwargs: MagicMock())
+        monkeypatch.setattr(query_planner, "Agent", agent_cls)
+        monkeypatch.setattr(query_planner, "_PLANNER_CACHE", {})
+
+        first = query_planner.create_query_planner("test")
+
+        assert query_planner.create_query_planner("test") is first
+        assert query_planner.create_query_planner("other") is not first
+        assert agent_cls.call_count == 2
+
+
+class TestPlanTemplates:
+    """Test plans built without the LLM for structurally fixed queries."""
+
+    async def test_uuid_query_is_planned_as_lookup(self, planner):
+        """Test that UUID-only queries become an exact LOOKUP."""
+        first = "550e8400-e29b-41d4-a716-446655440000"
+        second = "6ba7b810-9dad-11d1-80b4-00c04fd430c8"
+
+        plan = await query_planner.plan_query(f"{first}, {second} and {first}", model="test")
+
+        assert planner.run.call_count == 0
+        assert plan.query_type == QueryType.LOOKUP
+        assert plan.confidence == 1.0
+        assert plan.primary_query.parameters == {"keys": [first, second]}
+        assert plan.primary_query.query_string == f"LOOKUP '{first}', '{second}'"
+
+    async def test_query_with_other_words_uses_planner(self, planner):
+        """Test that a UUID inside a sentence still goes to the LLM."""
+        await query_planner.plan_query(
+            "who follows 550e8400-e29b-41d4-a716-446655440000", model="test"
+        )
+
+        assert planner.run.call_count == 1
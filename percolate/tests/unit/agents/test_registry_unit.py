@@ -0,0 +1,55 @@
+"""Unit tests for system agent-let discovery.
+
+Uses a temporary agentlets directory instead of the packaged schemas.
+"""
+
+import json
+import os
+
+import pytest
+
+from percolate.agents import registry
+
+
+@pytest.fixture
+def agentlets_dir(tmp_path, monkeypatch):
+    """Empty agentlets directory with a cold listing cache."""
+    monkeypatch.setattr(registry, "_get_agentlets_dir", lambda: tmp_path)
+    monkeypatch.setattr(registry, "_SYSTEM_AGENTLETS_CACHE", None)
+    return tmp_path
+
+
+def write_agentlet(directory, name: str, description: str) -> None:
+    """Write a minimal agent-let schema file."""
+    (directory / f"{name}.json").write_text(json.dumps({"short_name": name, "description": description}))
+
+
+class TestListSystemAgentlets:
+    """Test cached listing of system agent-lets."""
+
+    def test_listing_is_reused_until_directory_changes(self, agentlets_dir, monkeypatch):
+        """Test that files are parsed once until one is added."""
+        parsed = []
+        json_loads = registry.json_loads
+        monkeypatch.setattr(registry, "json_loads", lambda data: parsed.append(data) or json_loads(data))
+        write_agentlet(agentlets_dir, "researcher", "Research")
+
+        registry.list_system_agentlets()
+        registry.list_system_agentlets()
+        assert len(parsed) == 1
+
+        write_agentlet(agentlets_dir, "classifier", "Classify")
+        # Bump the mtime explicitly in case the filesystem's resolution is coarse
+        stat = agentlets_dir.stat()
+        os.utime(agentlets_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert sorted(a["uri"] for a in registry.list_system_agentlets()) == ["classifier", "researcher"]
+        assert len(parsed) == 3
+
+    def test_returned_entries_are_copies(self, agentlets_dir):
+        """Test that callers can't alter the cached listing."""
+        write_agentlet(agentlets_dir, "researcher", "Research")
+
+        registry.list_system_agentlets()[0]["description"] = "changed"
+
+        assert registry.list_system_agentlets()[0]["description"] == "Research"
@@ -0,0 +1,92 @@
+"""Unit tests for MCP tool wrapping.
+
+Tests the Pydantic AI wrapper around MCP tool functions without an agent
+or LLM.
+"""
+
+import asyncio
+
+from pydantic import BaseModel
+
+from percolate.agents.tool_wrapper import create_pydantic_tool, dedupe_tool_calls
+
+
+def make_counting_tool():
+    """Create a tool whose backend counts calls and yields to the loop."""
+    calls = []
+
+    async def search(ctx, query: str) -> list[str]:
+        """Search for a query."""
+        calls.append(query)
+        await asyncio.sleep(0.01)
+        return [query]
+
+    return create_pydantic_tool(search), calls
+
+
+class TestToolCallDedup:
+    """Test sharing of identical concurrent tool calls."""
+
+    async def test_concurrent_identical_calls_share_one_backend_call(self):
+        """Test that identical calls inside dedupe_tool_calls run once."""
+        tool, calls = make_counting_tool()
+
+        with dedupe_tool_calls():
+            results = await asyncio.gather(
+                tool.function(query="x"), tool.function(query="x"), tool.function(query="y")
+            )
+
+        assert results == [["x"], ["x"], ["y"]]
+        assert sorted(calls) == ["x", "y"]
+
+    async def test_calls_outside_block_are_not_shared(self):
+        """Test that calls run independently without dedupe_tool_calls."""
+        tool, calls = make_counting_tool()
+
+        await asyncio.gather(tool.function(query="x"), tool.function(query="x"))
+
+        assert calls == ["x", "x"]
+
+    async def test_completed_calls_are_not_reused(self):
+        """Test that only in-flight calls are shared."""
+        tool, calls = make_counting_tool()
+
+        with dedupe_tool_calls():
+            await tool.function(query="x")
+            await tool.function(query="x")
+
+        assert calls == ["x", "x"]
+
+
+class TestToolSchema:
+    """Test the JSON schema generated for MCP tool parameters."""
+
+    def test_parameter_types_are_described_accurately(self):
+        """Test that Optional, list and dict parameters keep their structure."""
+
+        async def query(ctx, text: str, limit: int | None = None, tags: list[str] | None = None, filters: dict[str, int] | None = None):
+            """Run a query."""
+
+        schema = create_pydantic_tool(query).function_schema.json_schema
+
+        assert "ctx" not in schema["properties"]
+        assert schema["required"] == ["text"]
+        assert schema["properties"]["limit"]["anyOf"] == [{"type": "integer"}, {"type": "null"}]
+        assert schema["properties"]["tags"]["anyOf"][0]["items"] == {"type": "string"}
+        assert schema["properties"]["filters"]["anyOf"][0]["additionalProperties"] == {"type": "integer"}
+        assert schema["properties"]["text"]["description"] == "text parameter"
+
+    def test_model_definitions_are_hoisted(self):
+        """Test that nested model references resolve against top-level $defs."""
+
+        class Point(BaseModel):
+            x: int
+            y: int
+
+        async def plot(points: list[Point]):
+            """Plot points."""
+
+        schema = create_pydantic_tool(plot).function_schema.json_schema
+
+        assert schema["properties"]["points"]["items"] == {"$ref": "#/$defs/Point"}
+        assert set(schema["$defs"]["Point"]["properties"]) == {"x", "y"}
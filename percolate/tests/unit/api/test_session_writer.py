@@ -0,0 +1,49 @@
+"""Unit tests for batched chat session writes."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from percolate.api.routers.chat.session_writer import SessionWriter
+
+
+def make_writer(**kwargs) -> tuple[SessionWriter, list[list[dict]]]:
+    """Create a writer whose store records the batches it saves."""
+    batches = []
+    store = MagicMock()
+    store.save_messages.side_effect = lambda messages: batches.append(messages)
+    return SessionWriter(store, **kwargs), batches
+
+
+class TestSessionWriter:
+    """Test background batching of session messages."""
+
+    async def test_messages_within_window_share_a_batch(self):
+        """Test that messages queued together are saved in one call, in order."""
+        writer, batches = make_writer(max_latency_ms=10)
+
+        for i in range(3):
+            writer.enqueue(session_id="s1", tenant_id="t", role="user", content=str(i))
+        await asyncio.sleep(0.05)
+
+        assert [[m["content"] for m in batch] for batch in batches] == [["0", "1", "2"]]
+        assert all("timestamp" in m for m in batches[0])
+        await writer.close()
+
+    async def test_batches_are_capped(self):
+        """Test that a batch never exceeds max_batch messages."""
+        writer, batches = make_writer(max_batch=2)
+
+        for i in range(5):
+            writer.enqueue(session_id="s1", tenant_id="t", role="user", content=str(i))
+        await writer.close()
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    async def test_close_saves_pending_messages(self):
+        """Test that messages still queued at shutdown are saved."""
+        writer, batches = make_writer(max_latency_ms=1000)
+
+        writer.enqueue(session_id="s1", tenant_id="t", role="user", content="bye")
+        await writer.close()
+
+        assert [m["content"] for batch in batches for m in batch] == ["bye"]
@@ -0,0 +1,67 @@
+"""Unit tests for batched session message saves.
+
+Uses an in-memory stand-in for the REM database.
+"""
+
+from percolate.memory.constants import TABLE_MESSAGES, TABLE_SESSIONS
+from percolate.memory.session_store import SessionStore
+
+
+class FakeDatabase:
+    """Records batch inserts; no sessions exist yet."""
+
+    def __init__(self):
+        self.batches: list[tuple[str, list[dict]]] = []
+
+    def lookup(self, table, key):
+        return []
+
+    def insert_batch(self, table, entities):
+        self.batches.append((table, entities))
+        return [f"entity-{i}" for i in range(len(entities))]
+
+
+def make_store() -> tuple[SessionStore, FakeDatabase]:
+    """Create a SessionStore backed by a FakeDatabase."""
+    store = SessionStore.__new__(SessionStore)
+    store.db = FakeDatabase()
+    return store, store.db
+
+
+class TestSaveMessages:
+    """Test saving several messages in one batch."""
+
+    def test_messages_are_inserted_in_one_batch(self):
+        """Test that each session is upserted once and messages keep their order."""
+        store, db = make_store()
+
+        ids = store.save_messages(
+            [
+                {"session_id": "s1", "tenant_id": "t", "role": "user", "content": "Hi", "timestamp": "T1"},
+                {"session_id": "s2", "tenant_id": "t", "role": "user", "content": "Yo", "timestamp": "T2"},
+                {
+                    "session_id": "s1",
+                    "tenant_id": "t",
+                    "role": "assistant",
+                    "content": "Hello",
+                    "agent_uri": "agent",
+                    "timestamp": "T3",
+                },
+            ]
+        )
+
+        (sessions_table, sessions), (messages_table, messages) = db.batches
+        assert (sessions_table, messages_table) == (TABLE_SESSIONS, TABLE_MESSAGES)
+        assert [s["session_id"] for s in sessions] == ["s1", "s2"]
+        assert sessions[0]["message_count"] == 2
+        assert sessions[0]["agent_uri"] == "agent"
+        assert (sessions[0]["created_at"], sessions[0]["updated_at"]) == ("T1", "T3")
+        assert [m["content"] for m in messages] == ["Hi", "Yo", "Hello"]
+        assert ids == [m["message_id"] for m in messages]
+
+    def test_unavailable_database_saves_nothing(self):
+        """Test that every message gets a None ID without a database."""
+        store, _ = make_store()
+        store.db = None
+
+        assert store.save_messages([{"session_id": "s1"}, {"session_id": "s2"}]) == [None, None]
@@ -4,9 +4,11 @@ Tests token-aware and record-based chunking without external dependencies.
 """
 
 import json
+import re
 
 import pytest
 
+from percolate.utils import chunking
 from percolate.utils.chunking import (
     chunk_by_records,
     chunk_by_tokens,
@@ -14,6 +16,7 @@ from percolate.utils.chunking import (
     estimate_tokens,
     get_optimal_chunk_size,
     is_list_content,
+    token_offsets,
 )
 
 
@@ -126,6 +129,57 @@ class TestTokenChunking:
         chunks = chunk_by_tokens("", "claude-sonnet-4-5")
         assert chunks == [""]
 
+    def test_content_is_tokenized_once(self, monkeypatch):
+        """Test that sentences and long-sentence pieces are counted from one tokenization."""
+        calls = []
+
+        def counting_offsets(content, model_name):
+            calls.append(content)
+            return token_offsets(content, model_name)
+
+        monkeypatch.setattr(chunking, "token_offsets", counting_offsets)
+        content = "This is sentence one. " * 500 + "word" * 10_000
+        chunks = chunk_by_tokens(content, "claude-sonnet-4-5", max_chunk_tokens=1000)
+
+        assert len(chunks) > 1
+        assert calls == [content]
+
+    def test_overlap_repeats_trailing_sentences(self):
+        """Test that each chunk starts with the last sentences of the previous one."""
+        content = " ".join(f"Sentence number {i} is here." for i in range(200))
+        chunks = chunk_by_tokens(content, "claude-sonnet-4-5", max_chunk_tokens=100, overlap_tokens=20)
+
+        numbers = [[int(n) for n in re.findall(r"number (\d+)", chunk)] for chunk in chunks]
+        for previous, current in zip(numbers[:-1], numbers[1:], strict=True):
+            overlap = previous.index(current[0])
+            assert 0 < len(previous) - overlap < len(current)
+            assert current[: len(previous) - overlap] == previous[overlap:]
+        assert sorted(set(sum(numbers, []))) == list(range(200))
+
+    def test_long_sentence_pieces_overlap(self):
+        """Test that pieces of a sentence longer than a chunk overlap."""
+        content = " ".join(f"w{i}" for i in range(2000))  # One sentence
+        chunks = chunk_by_tokens(content, "claude-sonnet-4-5", max_chunk_tokens=100, overlap_tokens=25)
+
+        spans = [(content.index(chunk), content.index(chunk) + len(chunk)) for chunk in chunks]
+        assert spans[0][0] == 0 and spans[-1][1] == len(content)
+        for (start, end), (next_start, _) in zip(spans[:-1], spans[1:], strict=True):
+            assert start < next_start < end
+
+    def test_overlap_must_be_smaller_than_chunk(self):
+        """Test that an overlap as large as a chunk is rejected."""
+        with pytest.raises(ValueError, match="overlap_tokens"):
+            chunk_by_tokens("text", "claude-sonnet-4-5", max_chunk_tokens=10, overlap_tokens=10)
+
+    def test_offsets_match_token_estimate(self):
+        """Test that the offsets give the same count as estimate_tokens."""
+        content = "Hello world. " * 50
+
+        offsets = token_offsets(content, "claude-sonnet-4-5")
+
+        assert len(offsets) == estimate_tokens(content, "claude-sonnet-4-5")
+        assert offsets == sorted(offsets)
+
 
 class TestListContentDetection:
     """Tests for list content type detection."""
@@ -0,0 +1,31 @@
+"""Tests for JSON serialization helpers."""
+
+import json
+
+from percolate.utils.serialization import json_dumps_canonical, json_dumps_indented, json_loads
+
+
+def test_canonical_json_ignores_key_order():
+    """Equal documents serialize to identical bytes regardless of key order."""
+    first = {"b": 1, "a": {"y": [1, 2], "x": None}}
+    second = {"a": {"x": None, "y": [1, 2]}, "b": 1}
+
+    assert json_dumps_canonical(first) == json_dumps_canonical(second)
+    assert json.loads(json_dumps_canonical(first)) == first
+
+
+def test_indented_json_round_trips():
+    """Indented output parses back to the same records."""
+    records = [{"id": 1, "name": "café"}, {"id": 2, "tags": ["a", "b"]}]
+
+    text = json_dumps_indented(records)
+
+    assert isinstance(text, str)
+    assert "\n  " in text
+    assert json_loads(text) == records
+    assert json_loads(text.encode()) == records
+
+
+def test_indented_json_accepts_non_string_keys():
+    """Non-string keys are stringified, as the stdlib json module does."""
+    assert json_loads(json_dumps_indented({1: "a"})) == {"1": "a"}